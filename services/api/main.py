@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import gc
+import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from auto_proposal_drafter.firestore_job_store import FirestoreJobStore
 from auto_proposal_drafter.generator import ProposalGenerator
 from auto_proposal_drafter.job_store import JobStore
 from auto_proposal_drafter.logging_config import setup_logging
-from auto_proposal_drafter.models.job import JobOutputs, JobRecord, JobStatus
+from auto_proposal_drafter.models.job import JobOutputs, JobStatus
 from auto_proposal_drafter.models.opportunity import Opportunity
 from auto_proposal_drafter.opportunity_repository import LocalOpportunityRepository
 from auto_proposal_drafter.post_processor import PostProcessor
@@ -32,33 +36,45 @@ class GenerateDraftResponse(BaseModel):
     status: JobStatus
 
 
-class JobResponse(BaseModel):
-    id: str
-    status: JobStatus
-    progress: float
-    outputs: JobOutputs
-    errors: list[str]
-
-    @staticmethod
-    def from_record(record: JobRecord) -> "JobResponse":
-        return JobResponse(
-            id=record.id,
-            status=record.status,
-            progress=record.progress,
-            outputs=record.outputs,
-            errors=list(record.errors),
-        )
+# JobRecord fields exposed by GET /v1/jobs/{job_id}
+JOB_RESPONSE_FIELDS = frozenset({"id", "status", "progress", "outputs", "errors"})
 
 
 # Environment configuration
 ENVIRONMENT = os.getenv("ENVIRONMENT", "dev")
 PROJECT_ID = os.getenv("PROJECT_ID")
 PUBSUB_TOPIC_DRAFT_REQUESTS = os.getenv("PUBSUB_TOPIC_DRAFT_REQUESTS", "draft-requests")
+DRAFT_WORKER_CONCURRENCY = int(os.getenv("DRAFT_WORKER_CONCURRENCY", "2"))
+DRAFT_QUEUE_MAXSIZE = int(os.getenv("DRAFT_QUEUE_MAXSIZE", "100"))
 
 # Setup logging
 setup_logging(environment=ENVIRONMENT, project_id=PROJECT_ID)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Local job queue for the non-Pub/Sub path, drained by a fixed pool of
+    # consumers. Created per lifespan so it belongs to the serving event loop.
+    queue: asyncio.Queue[tuple[str, GenerateDraftRequest]] = asyncio.Queue(
+        maxsize=DRAFT_QUEUE_MAXSIZE
+    )
+    app.state.draft_queue = queue
+    workers = [asyncio.create_task(_draft_worker(queue)) for _ in range(DRAFT_WORKER_CONCURRENCY)]
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
-app = FastAPI(title="Auto Proposal Drafter API", version="0.1.0")
+
+app = FastAPI(
+    title="Auto Proposal Drafter API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Use Firestore in production, in-memory for dev
 if ENVIRONMENT == "dev":
@@ -78,44 +94,70 @@ repository = LocalOpportunityRepository(base_path=repo_base_path)
 
 
 @app.post("/v1/drafts:generate", response_model=GenerateDraftResponse)
-async def generate_draft(request: GenerateDraftRequest, background_tasks: BackgroundTasks) -> GenerateDraftResponse:
-    job = job_store.create_job(source=request.source, record_id=request.record_id, priority=request.priority)
+async def generate_draft(request: GenerateDraftRequest) -> ORJSONResponse:
+    job = await asyncio.to_thread(
+        job_store.create_job, source=request.source, record_id=request.record_id, priority=request.priority
+    )
 
-    # In production, publish to Pub/Sub; in dev, use background task
+    # In production, publish to Pub/Sub; in dev, enqueue for the local workers.
+    # Await the batched publish without blocking the event loop on .result().
     if pubsub_client and ENVIRONMENT != "dev":
-        pubsub_client.publish_draft_request(
-            source=request.source,
-            record_id=request.record_id,
-            job_id=job.id,
-            priority=request.priority,
+        await asyncio.wrap_future(
+            pubsub_client.publish_draft_request(
+                source=request.source,
+                record_id=request.record_id,
+                job_id=job.id,
+                priority=request.priority,
+            )
         )
     else:
-        background_tasks.add_task(_run_job, job.id, request)
-
-    return GenerateDraftResponse(job_id=job.id, status=job.status)
-
-
-@app.get("/v1/jobs/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str) -> JobResponse:
-    record = job_store.get_job(job_id)
+        try:
+            app.state.draft_queue.put_nowait((job.id, request))
+        except asyncio.QueueFull:
+            await asyncio.to_thread(
+                job_store.update_job,
+                job.id,
+                status=JobStatus.failed,
+                progress=1.0,
+                errors=["Draft queue is full"],
+            )
+            raise HTTPException(status_code=503, detail="Draft queue is full")
+
+    # Returning a Response skips jsonable_encoder; response_model only feeds the OpenAPI schema.
+    return ORJSONResponse({"job_id": job.id, "status": job.status})
+
+
+@app.get("/v1/jobs/{job_id}")
+async def get_job(job_id: str) -> ORJSONResponse:
+    record = await asyncio.to_thread(job_store.get_job, job_id)
     if not record:
         raise HTTPException(status_code=404, detail="Job not found")
-    return JobResponse.from_record(record)
+    return ORJSONResponse(record.model_dump(mode="json", include=JOB_RESPONSE_FIELDS))
+
+
+async def _draft_worker(queue: asyncio.Queue[tuple[str, GenerateDraftRequest]]) -> None:
+    while True:
+        job_id, request = await queue.get()
+        try:
+            await _run_job(job_id, request)
+        except Exception:
+            # Keep the consumer alive; one bad job must not stall the queue.
+            logger.exception("Draft job failed", extra={"job_id": job_id})
+        finally:
+            queue.task_done()
 
 
 async def _run_job(job_id: str, request: GenerateDraftRequest) -> None:
-    job_store.update_job(job_id, status=JobStatus.in_progress, progress=0.1)
+    await asyncio.to_thread(job_store.update_job, job_id, status=JobStatus.in_progress, progress=0.1)
     try:
         opportunity = request.payload or repository.get(source=request.source, record_id=request.record_id)
         bundle = await asyncio.to_thread(proposal_generator.generate, opportunity)
         bundle_dict = bundle.model_dump()
-        outputs = JobOutputs(
-            structure=bundle_dict["structure"],
-            wire=bundle_dict["wire"],
-            estimate=bundle_dict["estimate"],
-            summary=bundle_dict["summary"],
+        # The bundle was produced by the generator; skip re-validating it.
+        outputs = JobOutputs.model_construct(**bundle_dict)
+        await asyncio.to_thread(
+            job_store.update_job, job_id, status=JobStatus.completed, progress=1.0, outputs=outputs
         )
-        job_store.update_job(job_id, status=JobStatus.completed, progress=1.0, outputs=outputs)
 
         # Post-process in dev mode
         if post_processor:
@@ -134,9 +176,17 @@ async def _run_job(job_id: str, request: GenerateDraftRequest) -> None:
                 pass  # Non-fatal, already logged
 
     except Exception as exc:  # pragma: no cover - safety net
-        job_store.update_job(job_id, status=JobStatus.failed, progress=1.0, errors=[str(exc)])
+        await asyncio.to_thread(
+            job_store.update_job, job_id, status=JobStatus.failed, progress=1.0, errors=[str(exc)]
+        )
 
 
 @app.get("/health")
-async def healthcheck() -> JSONResponse:
-    return JSONResponse({"status": "ok"})
+async def healthcheck() -> ORJSONResponse:
+    return ORJSONResponse({"status": "ok"})
+
+
+# Move everything allocated at import time (dictionaries, pydantic schemas,
+# clients) into the permanent generation so GC passes triggered by per-job
+# allocations do not keep rescanning it.
+gc.freeze()
@@ -2,21 +2,25 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
+import gc
 import logging
 import os
-import uuid
+import secrets
+from datetime import date, timedelta
+from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 
 from auto_proposal_drafter.firestore_job_store import FirestoreJobStore
 from auto_proposal_drafter.generator import ProposalGenerator
 from auto_proposal_drafter.logging_config import set_trace_id, setup_logging
 from auto_proposal_drafter.models.job import JobOutputs, JobStatus
 from auto_proposal_drafter.models.opportunity import Opportunity
+from auto_proposal_drafter.opportunity_repository import LocalOpportunityRepository
 from auto_proposal_drafter.post_processor import PostProcessor
 from auto_proposal_drafter.pubsub_client import PubSubClient
 
@@ -34,8 +38,21 @@ job_store = FirestoreJobStore(project_id=PROJECT_ID)
 pubsub_client = PubSubClient(project_id=PROJECT_ID)
 proposal_generator = ProposalGenerator()
 post_processor = PostProcessor(project_id=PROJECT_ID)
+repository = LocalOpportunityRepository(base_path=Path("data/opportunities").resolve())
 
-app = FastAPI(title="Auto Proposal Drafter Worker", version="0.1.0")
+# Maps PostProcessor.process_draft result keys to JobOutputs fields
+_POST_OUTPUT_FIELDS = {
+    "notion_url": "notion_url",
+    "figma_url": "figma_wire_json_url",
+    "sheets_url": "sheets_url",
+    "asana_url": "asana_task_url",
+}
+
+app = FastAPI(
+    title="Auto Proposal Drafter Worker",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 
 class PubSubMessage(BaseModel):
@@ -45,26 +62,28 @@ class PubSubMessage(BaseModel):
     subscription: str
 
 
+# Built once so hot paths call the compiled validators directly
+_PUBSUB_ADAPTER = TypeAdapter(PubSubMessage)
+
+
 @app.post("/v1/worker/process")
-async def process_draft_request(request: Request) -> JSONResponse:
+async def process_draft_request(request: Request) -> ORJSONResponse:
     """Process a draft generation request from Pub/Sub.
 
     This endpoint is called by Pub/Sub push subscription.
     """
-    # Generate trace ID for request tracking
-    trace_id = str(uuid.uuid4())
+    # Generate trace ID for request tracking (32 hex chars, W3C trace-id length)
+    trace_id = secrets.token_hex(16)
     set_trace_id(trace_id)
 
     try:
         # Parse Pub/Sub message
-        body = await request.json()
-        pubsub_message = PubSubMessage.model_validate(body)
+        pubsub_message = _PUBSUB_ADAPTER.validate_json(await request.body())
 
         # Decode message data
         message_data = pubsub_message.message.get("data", "")
         if message_data:
-            decoded_data = base64.b64decode(message_data).decode("utf-8")
-            payload = json.loads(decoded_data)
+            payload = orjson.loads(base64.b64decode(message_data))
         else:
             raise HTTPException(status_code=400, detail="No message data")
 
@@ -91,7 +110,7 @@ async def process_draft_request(request: Request) -> JSONResponse:
         # Process the job
         await _process_job(job_id, source, record_id)
 
-        return JSONResponse({"status": "success", "job_id": job_id})
+        return ORJSONResponse({"status": "success", "job_id": job_id})
 
     except Exception as exc:
         logger.error(
@@ -112,7 +131,9 @@ async def _process_job(job_id: str, source: str, record_id: str) -> None:
     """
     try:
         # Update job to in_progress
-        job_store.update_job(job_id, status=JobStatus.in_progress, progress=0.1)
+        await asyncio.to_thread(
+            job_store.update_job, job_id, status=JobStatus.in_progress, progress=0.1
+        )
 
         # Load opportunity from source
         # TODO: Implement actual repository based on source
@@ -127,10 +148,7 @@ async def _process_job(job_id: str, source: str, record_id: str) -> None:
             },
         )
 
-        # Update progress
-        job_store.update_job(job_id, progress=0.3)
-
-        # Generate draft bundle
+        # Generate draft bundle (redeliveries of the same opportunity hit the generator cache)
         bundle = await asyncio.to_thread(proposal_generator.generate, opportunity)
 
         logger.info(
@@ -144,26 +162,13 @@ async def _process_job(job_id: str, source: str, record_id: str) -> None:
             },
         )
 
-        # Update progress
-        job_store.update_job(job_id, progress=0.8)
-
-        # Prepare outputs
         bundle_dict = bundle.model_dump()
-        outputs = JobOutputs(
-            structure=bundle_dict["structure"],
-            wire=bundle_dict["wire"],
-            estimate=bundle_dict["estimate"],
-            summary=bundle_dict["summary"],
-        )
-
-        # Update job to completed
-        job_store.update_job(
-            job_id, status=JobStatus.completed, progress=1.0, outputs=outputs
-        )
 
-        # Post-process: generate Figma feed and other outputs
+        # Post-process (Figma feed and other outputs)
+        post_outputs: dict[str, str] = {}
         try:
-            post_outputs = post_processor.process_draft(
+            post_outputs = await asyncio.to_thread(
+                post_processor.process_draft,
                 job_id=job_id,
                 record_id=record_id,
                 structure=bundle.structure,
@@ -183,14 +188,25 @@ async def _process_job(job_id: str, source: str, record_id: str) -> None:
                 extra={"job_id": job_id, "error": str(post_exc)},
             )
 
-        # Publish completion event
-        pubsub_client.publish_draft_completed(
-            job_id=job_id,
-            record_id=record_id,
-            outputs=bundle_dict,
+        # Prepare outputs
+        # The bundle was produced by the generator; skip re-validating it.
+        outputs = JobOutputs.model_construct(
+            **bundle_dict,
+            **{
+                field: post_outputs[key]
+                for key, field in _POST_OUTPUT_FIELDS.items()
+                if key in post_outputs
+            },
         )
 
-        logger.info("Draft generation completed", extra={"job_id": job_id})
+        # Update job to completed (single write for status, outputs and URLs)
+        await asyncio.to_thread(
+            job_store.update_job,
+            job_id,
+            status=JobStatus.completed,
+            progress=1.0,
+            outputs=outputs,
+        )
 
     except Exception as exc:
         logger.error(
@@ -200,7 +216,8 @@ async def _process_job(job_id: str, source: str, record_id: str) -> None:
         )
 
         # Update job to failed
-        job_store.update_job(
+        await asyncio.to_thread(
+            job_store.update_job,
             job_id,
             status=JobStatus.failed,
             progress=1.0,
@@ -209,6 +226,19 @@ async def _process_job(job_id: str, source: str, record_id: str) -> None:
 
         raise
 
+    # Publish only once the COMPLETED state is stored, so subscribers never see
+    # an in-progress job. A publish failure propagates for redelivery but does
+    # not mark the stored job as failed.
+    await asyncio.wrap_future(
+        pubsub_client.publish_draft_completed(
+            job_id=job_id,
+            record_id=record_id,
+            outputs=bundle_dict,
+        )
+    )
+
+    logger.info("Draft generation completed", extra={"job_id": job_id})
+
 
 async def _load_opportunity(source: str, record_id: str) -> Opportunity:
     """Load opportunity from source system.
@@ -222,19 +252,19 @@ async def _load_opportunity(source: str, record_id: str) -> Opportunity:
     Returns:
         Opportunity instance
     """
-    # For now, return a mock opportunity
-    # This should be replaced with actual repository implementation
-    from pathlib import Path
+    return await asyncio.to_thread(_load_opportunity_sync, source, record_id)
 
-    fixture_path = Path("data/opportunities") / f"{record_id}.json"
-    if fixture_path.exists():
-        return Opportunity.model_validate_json(
-            fixture_path.read_text(encoding="utf-8")
-        )
 
-    # Return a minimal opportunity for testing
-    from datetime import date, timedelta
+def _load_opportunity_sync(source: str, record_id: str) -> Opportunity:
+    """Blocking part of ``_load_opportunity``, run in a worker thread."""
+    # For now, read local fixtures and fall back to a mock opportunity
+    # This should be replaced with actual repository implementation
+    try:
+        return repository.get(source=source, record_id=record_id)
+    except FileNotFoundError:
+        pass
 
+    # Return a minimal opportunity for testing
     return Opportunity(
         id=record_id,
         title="Sample Opportunity",
@@ -251,6 +281,12 @@ async def _load_opportunity(source: str, record_id: str) -> Opportunity:
 
 
 @app.get("/health")
-async def healthcheck() -> JSONResponse:
+async def healthcheck() -> ORJSONResponse:
     """Health check endpoint."""
-    return JSONResponse({"status": "ok"})
+    return ORJSONResponse({"status": "ok"})
+
+
+# Move everything allocated at import time (dictionaries, pydantic schemas,
+# clients) into the permanent generation so GC passes triggered by per-job
+# allocations do not keep rescanning it.
+gc.freeze()
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Callable, Iterable, Mapping, Sequence
+from types import MappingProxyType
+from typing import Iterable, Literal, Mapping, Sequence
 
 from .models.estimate import EstimateCoefficient, EstimateDraft, EstimateLineItem
 from .models.opportunity import Opportunity
@@ -10,18 +11,18 @@ from .models.structure import SectionSpec, SitePageSpec, StructureDraft
 from .models.wire import WireDraft, WirePage, WireProject, WireSection
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionDefinition:
     key: str
     label: str
     kind: str
     variant: str
     design_hours: float
-    copy_hints: Sequence[str]
-    placeholders: Mapping[str, str]
+    copy_hints: tuple[str, ...]
+    placeholders: tuple[tuple[str, str], ...]
 
 
-DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
+DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = MappingProxyType({
     "Hero/Center": SectionDefinition(
         key="Hero/Center",
         label="Hero",
@@ -33,10 +34,10 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
             "主要ベネフィットを箇条書き",
             "CTAリンクの誘導文",
         ),
-        placeholders={
-            "headline": "{company}が{persona_goal}を加速",
-            "sub": "{goal_phrase}"
-        },
+        placeholders=(
+            ("headline", "{company}が{persona_goal}を加速"),
+            ("sub", "{goal_phrase}"),
+        ),
     ),
     "SocialProof/LogosStrip": SectionDefinition(
         key="SocialProof/LogosStrip",
@@ -45,7 +46,10 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="LogosStrip",
         design_hours=1.0,
         copy_hints=("代表的な導入企業を3〜5社紹介",),
-        placeholders={"headline": "導入企業", "logos": "A社 / B社 / C社"},
+        placeholders=(
+            ("headline", "導入企業"),
+            ("logos", "A社 / B社 / C社"),
+        ),
     ),
     "Features/3ColsIcons": SectionDefinition(
         key="Features/3ColsIcons",
@@ -54,11 +58,11 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="3ColsIcons",
         design_hours=1.4,
         copy_hints=("ベネフィット3つを簡潔に",),
-        placeholders={
-            "col1": "特徴1",
-            "col2": "特徴2",
-            "col3": "特徴3",
-        },
+        placeholders=(
+            ("col1", "特徴1"),
+            ("col2", "特徴2"),
+            ("col3", "特徴3"),
+        ),
     ),
     "CaseStudies/Cards3": SectionDefinition(
         key="CaseStudies/Cards3",
@@ -67,7 +71,7 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="Cards3",
         design_hours=1.3,
         copy_hints=("代表的な成功事例を要約",),
-        placeholders={"title": "導入事例"},
+        placeholders=(("title", "導入事例"),),
     ),
     "Offer/PricingSimple": SectionDefinition(
         key="Offer/PricingSimple",
@@ -76,7 +80,7 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="PricingSimple",
         design_hours=1.2,
         copy_hints=("基本プランと差別化ポイント",),
-        placeholders={"plan": "スタンダードプラン"},
+        placeholders=(("plan", "スタンダードプラン"),),
     ),
     "FAQ/Accordion": SectionDefinition(
         key="FAQ/Accordion",
@@ -85,7 +89,10 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="Accordion",
         design_hours=1.0,
         copy_hints=("よくある質問と回答を3〜5件",),
-        placeholders={"q1": "質問1", "a1": "回答1"},
+        placeholders=(
+            ("q1", "質問1"),
+            ("a1", "回答1"),
+        ),
     ),
     "CTA/PrimaryBottom": SectionDefinition(
         key="CTA/PrimaryBottom",
@@ -94,7 +101,7 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="PrimaryBottom",
         design_hours=0.6,
         copy_hints=("フォーム送信を促す一文",),
-        placeholders={"cta": "資料請求はこちら"},
+        placeholders=(("cta", "資料請求はこちら"),),
     ),
     "Form/ContactBasic": SectionDefinition(
         key="Form/ContactBasic",
@@ -103,7 +110,7 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="ContactBasic",
         design_hours=1.2,
         copy_hints=("入力項目6つ程度に抑える",),
-        placeholders={"submit": "送信"},
+        placeholders=(("submit", "送信"),),
     ),
     "About/Split": SectionDefinition(
         key="About/Split",
@@ -112,7 +119,7 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="Split",
         design_hours=1.1,
         copy_hints=("企業概要と差別化を簡潔に",),
-        placeholders={"headline": "会社概要"},
+        placeholders=(("headline", "会社概要"),),
     ),
     "Services/Grid": SectionDefinition(
         key="Services/Grid",
@@ -121,12 +128,12 @@ DEFAULT_SECTIONS: Mapping[str, SectionDefinition] = {
         variant="Grid",
         design_hours=1.3,
         copy_hints=("提供サービスカテゴリを整理",),
-        placeholders={"headline": "提供サービス"},
+        placeholders=(("headline", "提供サービス"),),
     ),
-}
+})
 
 
-DEFAULT_PAGE_PRESETS: Mapping[str, Sequence[SitePageSpec]] = {
+DEFAULT_PAGE_PRESETS: Mapping[str, Sequence[SitePageSpec]] = MappingProxyType({
     "LP": (
         SitePageSpec(
             page_id="top",
@@ -160,7 +167,7 @@ DEFAULT_PAGE_PRESETS: Mapping[str, Sequence[SitePageSpec]] = {
             ],
         ),
     ),
-}
+})
 
 
 DEFAULT_RATES: Mapping[str, float] = {
@@ -177,17 +184,15 @@ DEFAULT_ASSUMPTIONS: Sequence[str] = (
 )
 
 
-@dataclass
+CoefficientCondition = Literal["short_deadline", "missing_copy", "cms_mentioned"]
+
+
+@dataclass(frozen=True)
 class CoefficientRule:
     name: str
     multiplier: float
     reason: str
-    predicate: Callable[[Opportunity, "GenerationContext"], bool]
-
-    def evaluate(self, opportunity: Opportunity, context: "GenerationContext") -> EstimateCoefficient | None:
-        if self.predicate(opportunity, context):
-            return EstimateCoefficient(name=self.name, multiplier=self.multiplier, reason=self.reason)
-        return None
+    condition: CoefficientCondition
 
 
 @dataclass
@@ -201,23 +206,66 @@ DEFAULT_COEFFICIENT_RULES: Sequence[CoefficientRule] = (
         name="短納期",
         multiplier=1.15,
         reason="納期が45日未満",
-        predicate=lambda opp, ctx: bool(opp.deadline and (opp.deadline - ctx.today).days < 45),
+        condition="short_deadline",
     ),
     CoefficientRule(
         name="素材未提供（コピー）",
         multiplier=1.2,
         reason="コピー素材が未支給",
-        predicate=lambda opp, ctx: opp.assets.copy is False,
+        condition="missing_copy",
     ),
     CoefficientRule(
         name="CMS要件含む",
         multiplier=1.1,
         reason="メモにCMS化要望",
-        predicate=lambda opp, ctx: bool(opp.notes and "CMS" in opp.notes.upper()),
+        condition="cms_mentioned",
     ),
 )
 
 
+def _evaluate_conditions(opportunity: Opportunity, today: date) -> dict[str, bool]:
+    """Compute every coefficient condition for one opportunity."""
+    deadline = opportunity.deadline
+    notes = opportunity.notes
+    return {
+        "short_deadline": bool(deadline and (deadline - today).days < 45),
+        "missing_copy": opportunity.assets.copy is False,
+        "cms_mentioned": bool(notes and "CMS" in notes.upper()),
+    }
+
+
+def evaluate_rules(
+    opportunity: Opportunity,
+    context: GenerationContext,
+    rules: Iterable[CoefficientRule],
+) -> list[EstimateCoefficient]:
+    """Return the coefficients whose condition holds for the opportunity.
+
+    Each condition is computed once up front, so the per-rule work is a
+    single dict lookup regardless of how many rules share a condition.
+    """
+    conditions = _evaluate_conditions(opportunity, context.today)
+    return [
+        EstimateCoefficient(name=rule.name, multiplier=rule.multiplier, reason=rule.reason)
+        for rule in rules
+        if conditions[rule.condition]
+    ]
+
+
+def evaluate_rules_batch(
+    opportunities: Sequence[Opportunity],
+    context: GenerationContext,
+    rules: Iterable[CoefficientRule],
+) -> list[list[EstimateCoefficient]]:
+    """Evaluate coefficient rules for a batch of opportunities.
+
+    Uses the same condition table as ``evaluate_rules``; the rules are
+    materialized once and every result gets its own coefficient instances.
+    """
+    rules = tuple(rules)
+    return [evaluate_rules(opportunity, context, rules) for opportunity in opportunities]
+
+
 def default_generation_context() -> GenerationContext:
     return GenerationContext(today=date.today())
 
@@ -228,7 +276,10 @@ __all__ = [
     "DEFAULT_RATES",
     "DEFAULT_COEFFICIENT_RULES",
     "DEFAULT_ASSUMPTIONS",
+    "CoefficientCondition",
     "CoefficientRule",
     "GenerationContext",
+    "evaluate_rules",
+    "evaluate_rules_batch",
     "default_generation_context",
 ]
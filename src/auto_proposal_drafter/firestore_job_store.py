@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import logging
+import secrets
+import time
 from datetime import datetime
 from typing import Optional
 
 from google.cloud import firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
+from pydantic import TypeAdapter
 
 from .models.job import JobOutputs, JobRecord, JobStatus
 
 logger = logging.getLogger(__name__)
 
+_OUTPUTS_ADAPTER = TypeAdapter(JobOutputs)
+
 
 class FirestoreJobStore:
     """Firestore-backed job store for production use."""
@@ -71,11 +76,15 @@ class FirestoreJobStore:
         progress: float | None = None,
         outputs: JobOutputs | None = None,
         errors: list[str] | None = None,
-    ) -> JobRecord:
-        """Update job fields in Firestore."""
+    ) -> None:
+        """Update job fields in Firestore.
+
+        The document is not read back; use ``get_job`` when the updated
+        record is needed.
+        """
         doc_ref = self._collection.document(job_id)
 
-        update_data: dict = {"updated_at": datetime.utcnow()}
+        update_data: dict = {"updated_at": firestore.SERVER_TIMESTAMP}
 
         if status is not None:
             update_data["status"] = status.value
@@ -84,7 +93,7 @@ class FirestoreJobStore:
             update_data["progress"] = progress
 
         if outputs is not None:
-            update_data["outputs"] = outputs.model_dump()
+            update_data["outputs_json"] = self._outputs_to_firestore(outputs)
 
         if errors is not None:
             update_data["errors"] = errors
@@ -100,10 +109,6 @@ class FirestoreJobStore:
             },
         )
 
-        # Fetch and return updated job
-        updated_doc = doc_ref.get()
-        return self._from_firestore_dict(updated_doc.id, updated_doc.to_dict())
-
     def list_jobs(
         self,
         *,
@@ -130,43 +135,56 @@ class FirestoreJobStore:
 
     def _generate_id(self, record_id: str | None) -> str:
         """Generate a unique job ID."""
-        ts = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        # Use Firestore auto-generated ID for uniqueness
-        doc_ref = self._collection.document()
-        suffix = doc_ref.id[:6]
+        suffix = secrets.token_hex(3)
 
         if record_id:
             safe = record_id.replace("/", "-")
             return f"job_{safe}_{suffix}"
+        ts = time.strftime("%Y%m%d%H%M%S", time.gmtime())
         return f"job_{ts}_{suffix}"
 
     def _to_firestore_dict(self, job: JobRecord) -> dict:
-        """Convert JobRecord to Firestore document dict."""
+        """Convert JobRecord to Firestore document dict.
+
+        Timestamps are written as server-side sentinels; the returned
+        JobRecord keeps its client-side values.
+        """
         data = {
-            "status": job.status.value,
+            "status": job.status,
             "source": job.source,
             "record_id": job.record_id,
             "priority": job.priority,
             "progress": job.progress,
-            "created_at": job.created_at,
-            "updated_at": job.updated_at,
+            "created_at": firestore.SERVER_TIMESTAMP,
+            "updated_at": firestore.SERVER_TIMESTAMP,
             "errors": job.errors,
         }
 
         if job.outputs:
-            data["outputs"] = job.outputs.model_dump()
+            data["outputs_json"] = self._outputs_to_firestore(job.outputs)
 
         return data
 
+    def _outputs_to_firestore(self, outputs: JobOutputs) -> bytes:
+        """Serialize JobOutputs to JSON bytes for a Firestore bytes field.
+
+        One pydantic-core pass produces the payload, and a single bytes
+        value is cheaper to encode than a deeply nested Firestore map.
+        """
+        return _OUTPUTS_ADAPTER.dump_json(outputs)
+
     def _from_firestore_dict(self, job_id: str, data: dict) -> JobRecord:
         """Convert Firestore document dict to JobRecord."""
         outputs = None
-        if "outputs" in data and data["outputs"]:
+        if data.get("outputs_json"):
+            outputs = _OUTPUTS_ADAPTER.validate_json(data["outputs_json"])
+        elif data.get("outputs"):
+            # Documents written before outputs were stored as JSON bytes
             outputs = JobOutputs.model_validate(data["outputs"])
 
         return JobRecord(
             id=job_id,
-            status=JobStatus(data["status"]),
+            status=data["status"],
             source=data["source"],
             record_id=data.get("record_id"),
             priority=data.get("priority"),
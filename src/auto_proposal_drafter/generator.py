@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Mapping, Sequence
 
 from pydantic import BaseModel
 
@@ -13,7 +16,9 @@ from .dictionaries import (
     DEFAULT_RATES,
     DEFAULT_SECTIONS,
     GenerationContext,
+    SectionDefinition,
     default_generation_context,
+    evaluate_rules,
 )
 from .models.estimate import EstimateDraft, EstimateLineItem
 from .models.opportunity import Opportunity
@@ -21,7 +26,7 @@ from .models.structure import SectionSpec, SitePageSpec, StructureDraft
 from .models.wire import WireDraft, WirePage, WireProject, WireSection
 
 
-@dataclass
+@dataclass(slots=True)
 class DraftBundle:
     structure: StructureDraft
     wire: WireDraft
@@ -32,18 +37,183 @@ class DraftBundle:
         return {
             "structure": self.structure.model_dump(),
             "wire": self.wire.model_dump(),
-            "estimate": {
-                **self.estimate.model_dump(),
-                "line_items": [
-                    {**item.model_dump(), "cost": item.cost}
-                    for item in self.estimate.line_items
-                ],
-            },
+            "estimate": self.estimate.model_dump(),
             "summary": self.summary_markdown,
         }
 
 
+@dataclass(slots=True)
+class _OpportunityText:
+    """Derived opportunity strings, computed once per ``generate()`` call."""
+
+    title_lower: str
+    goal_lower: str
+    goal: str
+    persona: str
+    goal_phrase: str
+
+
+class BundleCache:
+    """Bounded LRU of generated bundles keyed by opportunity content.
+
+    Generation is deterministic for a given opportunity and day, so
+    re-emitted deals, Pub/Sub redeliveries and identical re-generations can
+    reuse an earlier bundle. Cached bundles are shared between callers and
+    must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._bundles: OrderedDict[str, DraftBundle] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(opportunity: Opportunity, today: date) -> str:
+        digest = hashlib.blake2b(opportunity.model_dump_json().encode("utf-8"), digest_size=16)
+        digest.update(today.isoformat().encode("ascii"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> DraftBundle | None:
+        with self._lock:
+            bundle = self._bundles.get(key)
+            if bundle is not None:
+                self._bundles.move_to_end(key)
+            return bundle
+
+    def put(self, key: str, bundle: DraftBundle) -> None:
+        with self._lock:
+            self._bundles[key] = bundle
+            self._bundles.move_to_end(key)
+            if len(self._bundles) > self._maxsize:
+                self._bundles.popitem(last=False)
+
+
+_BRAND_COLOR_TOKEN = "ブランドカラー"
+
+_CopyBuilder = Callable[[Opportunity, _OpportunityText], tuple[str, ...]]
+
+_DEFAULT_FEATURES = ("高いCVR", "直感的な導線", "運用のしやすさ")
+
+
+def _hero_copy(opportunity: Opportunity, text: _OpportunityText) -> tuple[str, ...]:
+    return (
+        f"{opportunity.company}が{text.goal_phrase}を支援",
+        f"{text.persona}の課題を{text.goal}視点で解決",
+        "まずは資料請求・お問い合わせで詳細をご確認ください",
+    )
+
+
+def _social_proof_copy(opportunity: Opportunity, text: _OpportunityText) -> tuple[str, ...]:
+    refs = ", ".join(opportunity.references[:3]) if opportunity.references else "業界各社"
+    return (
+        f"{refs}などで導入実績",
+        "安心してご相談いただけます",
+    )
+
+
+def _features_copy(opportunity: Opportunity, text: _OpportunityText) -> tuple[str, ...]:
+    musts = opportunity.must_have[:3] or _DEFAULT_FEATURES
+    return tuple(f"特徴{i+1}: {must}" for i, must in enumerate(musts))
+
+
+def _offer_copy(opportunity: Opportunity, text: _OpportunityText) -> tuple[str, ...]:
+    budget = opportunity.budget_band or "要相談"
+    return (
+        "スピード重視の標準パッケージ",
+        f"概算費用帯: {budget}",
+    )
+
+
+def _about_copy(opportunity: Opportunity, text: _OpportunityText) -> tuple[str, ...]:
+    return (
+        f"{opportunity.company}の事業概要とミッション",
+        "沿革・主要メンバーの紹介",
+    )
+
+
+def _static_copy(*lines: str) -> _CopyBuilder:
+    return lambda opportunity, text: lines
+
+
+_PlaceholderFn = Callable[[str, str, str], str]
+
+
+def _compile_placeholder(template: str) -> _PlaceholderFn:
+    """Wrap a placeholder template as a ``(company, persona_goal, goal_phrase)`` closure."""
+    if "{" not in template and "}" not in template:
+        return lambda company, persona_goal, goal_phrase: template
+    render = template.format
+    return lambda company, persona_goal, goal_phrase: render(
+        company=company, persona_goal=persona_goal, goal_phrase=goal_phrase
+    )
+
+
+_Placeholders = tuple[tuple[str, _PlaceholderFn], ...]
+_ResolvedSection = tuple[SectionSpec, SectionDefinition | None, _Placeholders]
+_ResolvedPage = tuple[SitePageSpec, tuple[_ResolvedSection, ...]]
+
+
+def _resolve_presets(
+    page_presets: Mapping[str, Sequence[SitePageSpec]],
+    sections: Mapping[str, SectionDefinition],
+) -> dict[str, tuple[_ResolvedPage, ...]]:
+    """Join every preset section with its definition and compiled placeholders.
+
+    Presets and definitions are fixed per generator, so ``generate()`` walks
+    the joined tree without any per-section lookups.
+    """
+    index: dict[tuple[str, ...], tuple[SectionDefinition, _Placeholders]] = {
+        tuple(key.split("/", 1)): (
+            definition,
+            tuple((name, _compile_placeholder(template)) for name, template in definition.placeholders),
+        )
+        for key, definition in sections.items()
+    }
+    unresolved: tuple[None, _Placeholders] = (None, ())
+    return {
+        site_type: tuple(
+            (
+                preset,
+                tuple(
+                    (section, *index.get((section.kind, section.variant), unresolved))
+                    for section in preset.sections
+                ),
+            )
+            for preset in presets
+        )
+        for site_type, presets in page_presets.items()
+    }
+
+
+_DEFAULT_RESOLVED_PRESETS = _resolve_presets(DEFAULT_PAGE_PRESETS, DEFAULT_SECTIONS)
+
+
 class ProposalGenerator:
+    _COPY_BUILDERS: dict[str, _CopyBuilder] = {
+        "Hero": _hero_copy,
+        "SocialProof": _social_proof_copy,
+        "Features": _features_copy,
+        "CaseStudies": _static_copy(
+            "対象業界での成功事例を掲載",
+            "導入背景と成果を数値で提示",
+        ),
+        "Offer": _offer_copy,
+        "FAQ": _static_copy(
+            "導入スケジュールや体制のFAQを整備",
+            "セキュリティ・保守に関する質問も想定",
+        ),
+        "CTA": _static_copy("お気軽に資料請求/打ち合わせをご依頼ください"),
+        "Form": _static_copy(
+            "氏名・会社名・連絡先・相談内容を想定",
+            "6項目以内で離脱を抑制",
+        ),
+        "About": _about_copy,
+        "Services": _static_copy(
+            "提供サービスカテゴリを分かりやすく整理",
+            "オプション対応範囲も記載",
+        ),
+    }
+
     def __init__(
         self,
         *,
@@ -53,93 +223,142 @@ class ProposalGenerator:
         assumptions: Sequence[str] = DEFAULT_ASSUMPTIONS,
         coefficient_rules=DEFAULT_COEFFICIENT_RULES,
         context_factory=default_generation_context,
+        cache_size: int = 256,
     ) -> None:
         self._page_presets = page_presets
         self._sections = sections
-        self._rates = dict(rates or DEFAULT_RATES)
-        self._assumptions = tuple(assumptions)
-        self._coefficient_rules = tuple(coefficient_rules)
+        # The defaults are immutable tuples or never written to; share them
+        # instead of copying on every instantiation.
+        self._rates = dict(rates) if rates else DEFAULT_RATES
+        self._assumptions = assumptions if assumptions is DEFAULT_ASSUMPTIONS else tuple(assumptions)
+        self._coefficient_rules = (
+            coefficient_rules
+            if coefficient_rules is DEFAULT_COEFFICIENT_RULES
+            else tuple(coefficient_rules)
+        )
         self._context_factory = context_factory
+        self._bundle_cache = BundleCache(cache_size) if cache_size else None
+        if page_presets is DEFAULT_PAGE_PRESETS and sections is DEFAULT_SECTIONS:
+            self._resolved_presets = _DEFAULT_RESOLVED_PRESETS
+        else:
+            self._resolved_presets = _resolve_presets(page_presets, sections)
 
     def generate(self, opportunity: Opportunity) -> DraftBundle:
+        """Generate a draft bundle, reusing a cached one for identical input.
+
+        Returned bundles may be shared with other callers; do not mutate them.
+        Pass ``cache_size=0`` to the constructor to disable the cache.
+        """
         context = self._context_factory()
-        site_type = self._infer_site_type(opportunity)
-        structure = self._build_structure(opportunity, site_type)
+        if self._bundle_cache is None:
+            return self._generate(opportunity, context)
+        key = BundleCache.key_for(opportunity, context.today)
+        bundle = self._bundle_cache.get(key)
+        if bundle is None:
+            bundle = self._generate(opportunity, context)
+            self._bundle_cache.put(key, bundle)
+        return bundle
+
+    def _generate(self, opportunity: Opportunity, context: GenerationContext) -> DraftBundle:
+        text = self._derive_text(opportunity)
+        site_type = self._infer_site_type(opportunity, text)
+        site_map, wire_pages, design_items, flows = self._build_pages(opportunity, site_type, text)
+        structure = StructureDraft(
+            site_map=site_map,
+            flows=flows or ["Top→Form"],
+            uncertains=self._derive_uncertains(opportunity),
+            risks=self._derive_risks(opportunity, context.today),
+        )
         context.structure = structure
-        wire = self._build_wire(opportunity, structure)
-        estimate = self._build_estimate(opportunity, structure, context)
+        project = WireProject(id=opportunity.id, title=f"{opportunity.company} {opportunity.title}")
+        wire = WireDraft(project=project, pages=wire_pages)
+        estimate = self._build_estimate(opportunity, structure, design_items, context)
         summary = self._build_summary(opportunity, structure, estimate)
         return DraftBundle(structure=structure, wire=wire, estimate=estimate, summary_markdown=summary)
 
-    def _infer_site_type(self, opportunity: Opportunity) -> str:
-        title = opportunity.title.lower()
-        goal = opportunity.goal.lower()
-        if "lp" in title or "ランディング" in opportunity.title:
+    def _derive_text(self, opportunity: Opportunity) -> _OpportunityText:
+        goal = opportunity.goal or "成果"
+        return _OpportunityText(
+            title_lower=opportunity.title.lower(),
+            goal_lower=opportunity.goal.lower(),
+            goal=goal,
+            persona=opportunity.persona or "想定顧客",
+            goal_phrase=self._goal_phrase(goal),
+        )
+
+    def _infer_site_type(self, opportunity: Opportunity, text: _OpportunityText) -> str:
+        if "lp" in text.title_lower or "ランディング" in opportunity.title:
             return "LP"
-        if "リード" in goal or "lead" in goal:
+        if "リード" in text.goal_lower or "lead" in text.goal_lower:
             return "LP"
-        if "採用" in goal:
+        if "採用" in text.goal_lower:
             return "Corporate"
         return "LP"
 
-    def _build_structure(self, opportunity: Opportunity, site_type: str) -> StructureDraft:
-        pages = list(self._page_presets.get(site_type, ()))
-        if not pages:
-            pages = list(self._page_presets["LP"])
-        resolved_pages: list[SitePageSpec] = []
-        for preset in pages:
-            sections: list[SectionSpec] = []
-            for section in preset.sections:
-                definition = self._sections.get(f"{section.kind}/{section.variant}")
-                if not definition:
-                    sections.append(section)
-                    continue
-                copy = list(self._build_section_copy(opportunity, definition))
-                sections.append(
-                    SectionSpec(kind=section.kind, variant=section.variant, copy=copy)
-                )
-            resolved_pages.append(
-                SitePageSpec(
-                    page_id=preset.page_id,
-                    type=preset.type,
-                    goal=preset.goal,
-                    sections=sections,
-                    notes=preset.notes,
-                )
-            )
+    def _build_pages(
+        self, opportunity: Opportunity, site_type: str, text: _OpportunityText
+    ) -> tuple[list[SitePageSpec], list[WirePage], list[EstimateLineItem], list[str]]:
+        """Walk the preset section tree once.
 
-        uncertains = self._derive_uncertains(opportunity)
-        risks = self._derive_risks(opportunity)
-        flows = self._derive_flows(resolved_pages)
-        return StructureDraft(site_map=resolved_pages, flows=flows, uncertains=uncertains, risks=risks)
-
-    def _build_wire(self, opportunity: Opportunity, structure: StructureDraft) -> WireDraft:
-        pages: list[WirePage] = []
-        for page in structure.site_map:
-            sections: list[WireSection] = []
-            for section in page.sections:
-                definition = self._sections.get(f"{section.kind}/{section.variant}")
+        Each section feeds the site map, the wire section, the design line
+        items and the page's flow edges in the same pass.
+        """
+        presets = self._resolved_presets.get(site_type) or self._resolved_presets["LP"]
+        site_map: list[SitePageSpec] = []
+        wire_pages: list[WirePage] = []
+        design_items: list[EstimateLineItem] = []
+        flows: list[str] = []
+        # Hoist attribute lookups out of the per-section loop.
+        build_copy = self._build_section_copy
+        emit_item = self._emit_estimate_item
+        add_design_item = design_items.append
+        company = opportunity.company
+        for preset, resolved_sections in presets:
+            page_label = preset.page_id.title()
+            sections: list[SectionSpec] = []
+            wire_sections: list[WireSection] = []
+            add_section = sections.append
+            add_wire_section = wire_sections.append
+            kinds: set[str] = set()
+            for section, definition, placeholder_fns in resolved_sections:
+                kind = section.kind
                 placeholders = None
                 if definition:
+                    copy = list(build_copy(opportunity, definition, text))
+                    add_section(section.model_copy(update={"copy": copy}))
+                    add_design_item(emit_item(page_label, definition))
                     placeholders = {
-                        key: value.format(
-                            company=opportunity.company,
-                            persona_goal=(opportunity.goal or "成果"),
-                            goal_phrase=self._goal_phrase(opportunity),
-                        )
-                        for key, value in definition.placeholders.items()
+                        name: fn(company, text.goal, text.goal_phrase) for name, fn in placeholder_fns
                     }
-                sections.append(
-                    WireSection(kind=section.kind, variant=section.variant, placeholders=placeholders)
-                )
-            pages.append(WirePage(page_id=page.page_id, sections=sections, notes=page.notes))
-        project = WireProject(id=opportunity.id, title=f"{opportunity.company} {opportunity.title}")
-        return WireDraft(project=project, pages=pages)
+                else:
+                    add_section(section)
+                add_wire_section(WireSection(kind=kind, variant=section.variant, placeholders=placeholders))
+                kinds.add(kind)
+            site_map.append(preset.model_copy(update={"sections": sections}))
+            wire_pages.append(WirePage(page_id=preset.page_id, sections=wire_sections, notes=preset.notes))
+            self._emit_flows(flows, page_label, kinds)
+        return site_map, wire_pages, design_items, flows
+
+    def _emit_estimate_item(self, page_label: str, definition: SectionDefinition) -> EstimateLineItem:
+        return EstimateLineItem(
+            item=f"{page_label}: {definition.label}",
+            qty=1,
+            hours=round(definition.design_hours, 1),
+            rate=self._rates["Design"],
+            role="Design",
+        )
+
+    def _emit_flows(self, flows: list[str], page_label: str, kinds: set[str]) -> None:
+        if "Form" in kinds:
+            flows.append(f"{page_label}→Form")
+        if "CTA" in kinds:
+            flows.append(f"{page_label}→CTA")
 
     def _build_estimate(
         self,
         opportunity: Opportunity,
         structure: StructureDraft,
+        design_items: list[EstimateLineItem],
         context: GenerationContext,
     ) -> EstimateDraft:
         line_items: list[EstimateLineItem] = []
@@ -153,22 +372,7 @@ class ProposalGenerator:
                 role="IA",
             )
         )
-        for page in structure.site_map:
-            for section in page.sections:
-                definition = self._sections.get(f"{section.kind}/{section.variant}")
-                if not definition:
-                    continue
-                hours = definition.design_hours
-                item_label = f"{page.page_id.title()}: {definition.label}"
-                line_items.append(
-                    EstimateLineItem(
-                        item=item_label,
-                        qty=1,
-                        hours=round(hours, 1),
-                        rate=self._rates["Design"],
-                        role="Design",
-                    )
-                )
+        line_items.extend(design_items)
         pm_hours = max(4.0, len(line_items) * 0.6)
         line_items.append(
             EstimateLineItem(
@@ -180,11 +384,7 @@ class ProposalGenerator:
             )
         )
 
-        coefficients = [
-            coeff
-            for rule in self._coefficient_rules
-            if (coeff := rule.evaluate(opportunity, context)) is not None
-        ]
+        coefficients = evaluate_rules(opportunity, context, self._coefficient_rules)
 
         assumptions = list(self._assumptions)
         if opportunity.assets.photo is False:
@@ -200,93 +400,49 @@ class ProposalGenerator:
         structure: StructureDraft,
         estimate: EstimateDraft,
     ) -> str:
-        total_base = sum(item.cost for item in estimate.line_items)
-        total = total_base
-        coeff_summary: list[str] = []
-        for coeff in estimate.coefficients:
-            total *= coeff.multiplier
-            coeff_summary.append(f"- {coeff.name} ×{coeff.multiplier:.2f} ({coeff.reason})")
-        sections = sum(len(page.sections) for page in structure.site_map)
-        uncertains = "\n".join(f"- {item}" for item in structure.uncertains) or "- なし"
-        risks = "\n".join(f"- {item}" for item in structure.risks) or "- なし"
-
-        summary_lines = [
-            f"## 提案サマリ",
-            f"- 案件ID: {opportunity.id}",
-            f"- 目的: {opportunity.goal}",
-            f"- セクション数: {sections}",
-            f"- 基本見積: ¥{int(total_base):,}",
-            f"- 係数適用後見積: ¥{int(total):,}",
-            "",
-            "## 係数",
-            "\n".join(coeff_summary) if coeff_summary else "- なし",
-            "",
-            "## 不確定事項",
-            uncertains,
-            "",
-            "## リスク",
-            risks,
-        ]
-        return "\n".join(summary_lines)
-
-    def _build_section_copy(self, opportunity: Opportunity, definition) -> Iterable[str]:
-        goal_phrase = self._goal_phrase(opportunity)
-        persona = opportunity.persona or "想定顧客"
-        goal = opportunity.goal or "成果"
-        if definition.kind == "Hero":
-            return (
-                f"{opportunity.company}が{goal_phrase}を支援",
-                f"{persona}の課題を{goal}視点で解決",
-                "まずは資料請求・お問い合わせで詳細をご確認ください",
-            )
-        if definition.kind == "SocialProof":
-            refs = ", ".join(opportunity.references[:3]) if opportunity.references else "業界各社"
-            return (
-                f"{refs}などで導入実績",
-                "安心してご相談いただけます",
-            )
-        if definition.kind == "Features":
-            musts = list(opportunity.must_have[:3]) or ["高いCVR","直感的な導線","運用のしやすさ"]
-            return tuple(f"特徴{i+1}: {must}" for i, must in enumerate(musts))
-        if definition.kind == "CaseStudies":
-            return (
-                "対象業界での成功事例を掲載",
-                "導入背景と成果を数値で提示",
-            )
-        if definition.kind == "Offer":
-            budget = opportunity.budget_band or "要相談"
-            return (
-                "スピード重視の標準パッケージ",
-                f"概算費用帯: {budget}",
-            )
-        if definition.kind == "FAQ":
-            return (
-                "導入スケジュールや体制のFAQを整備",
-                "セキュリティ・保守に関する質問も想定",
-            )
-        if definition.kind == "CTA":
-            return (
-                "お気軽に資料請求/打ち合わせをご依頼ください",
-            )
-        if definition.kind == "Form":
-            return (
-                "氏名・会社名・連絡先・相談内容を想定",
-                "6項目以内で離脱を抑制",
-            )
-        if definition.kind == "About":
-            return (
-                f"{opportunity.company}の事業概要とミッション",
-                "沿革・主要メンバーの紹介",
-            )
-        if definition.kind == "Services":
-            return (
-                "提供サービスカテゴリを分かりやすく整理",
-                "オプション対応範囲も記載",
-            )
-        return definition.copy_hints
+        total_base, total = estimate.totals()
+        sections = sum([len(page.sections) for page in structure.site_map])
 
-    def _goal_phrase(self, opportunity: Opportunity) -> str:
-        goal = opportunity.goal or "成果"
+        lines: list[str] = []
+        append = lines.append
+        append("## 提案サマリ")
+        append(f"- 案件ID: {opportunity.id}")
+        append(f"- 目的: {opportunity.goal}")
+        append(f"- セクション数: {sections}")
+        append(f"- 基本見積: ¥{int(total_base):,}")
+        append(f"- 係数適用後見積: ¥{int(total):,}")
+        append("")
+        append("## 係数")
+        if estimate.coefficients:
+            for coeff in estimate.coefficients:
+                append(f"- {coeff.name} ×{coeff.multiplier:.2f} ({coeff.reason})")
+        else:
+            append("- なし")
+        append("")
+        append("## 不確定事項")
+        self._append_bullets(append, structure.uncertains)
+        append("")
+        append("## リスク")
+        self._append_bullets(append, structure.risks)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _append_bullets(append: Callable[[str], None], items: Sequence[str]) -> None:
+        if not items:
+            append("- なし")
+            return
+        for item in items:
+            append(f"- {item}")
+
+    def _build_section_copy(
+        self, opportunity: Opportunity, definition: SectionDefinition, text: _OpportunityText
+    ) -> Iterable[str]:
+        builder = self._COPY_BUILDERS.get(definition.kind)
+        if builder is None:
+            return definition.copy_hints
+        return builder(opportunity, text)
+
+    def _goal_phrase(self, goal: str) -> str:
         if "リード" in goal:
             return "B2B向けのリード獲得"
         if "採用" in goal:
@@ -307,25 +463,15 @@ class ProposalGenerator:
             items.append("必須機能の確定")
         return items
 
-    def _derive_risks(self, opportunity: Opportunity) -> list[str]:
+    def _derive_risks(self, opportunity: Opportunity, today: date) -> list[str]:
         risks: list[str] = []
         if opportunity.assets.copy is False:
             risks.append("コピー未提供に伴う制作遅延")
-        if opportunity.deadline and (opportunity.deadline - date.today()).days < 45:
+        if opportunity.deadline and (opportunity.deadline - today).days < 45:
             risks.append("短納期でのスケジュール逼迫")
-        if "ブランドカラー" in "".join(opportunity.constraints):
+        if any(_BRAND_COLOR_TOKEN in constraint for constraint in opportunity.constraints):
             risks.append("ブランドガイドライン厳守によるリワーク")
         return risks
 
-    def _derive_flows(self, pages: Sequence[SitePageSpec]) -> list[str]:
-        flows: list[str] = []
-        for page in pages:
-            cta_kinds = [section.kind for section in page.sections if section.kind in {"CTA", "Form"}]
-            if "Form" in cta_kinds:
-                flows.append(f"{page.page_id.title()}→Form")
-            if "CTA" in cta_kinds:
-                flows.append(f"{page.page_id.title()}→CTA")
-        return flows or ["Top→Form"]
-
 
-__all__ = ["ProposalGenerator", "DraftBundle"]
+__all__ = ["ProposalGenerator", "DraftBundle", "BundleCache"]
@@ -2,17 +2,33 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
 from typing import Any
 
-from google.cloud import secretmanager
-from hubspot import HubSpot
-from hubspot.crm.deals import SimplePublicObjectInput
-
-from ..models.opportunity import Opportunity
+from ..models.opportunity import Opportunity, OpportunityAssets
+from ..secret_manager import access_secret
 
 logger = logging.getLogger(__name__)
 
+_DEAL_PROPERTIES = [
+    "dealname",
+    "company",
+    "goal",
+    "persona",
+    "deadline",
+    "budget",
+    "must_have_features",
+    "references",
+    "constraints",
+    "has_copy",
+    "has_photos",
+]
+# HubSpot's search API returns at most 100 deals per page.
+_PAGE_SIZE = 100
+_TRUTHY = frozenset({"true", "True", "TRUE", "1"})
+_REQUIRED_TEXT_FIELDS = ("id", "title", "company", "goal")
+
 
 class HubSpotIngestor:
     """Ingestor for HubSpot CRM deals."""
@@ -33,6 +49,8 @@ class HubSpotIngestor:
         if not api_key and project_id:
             api_key = self._get_secret(project_id, "hubspot-api-key")
 
+        from hubspot import HubSpot
+
         self.client = HubSpot(access_token=api_key)
 
     def get_opportunity(self, deal_id: str) -> Opportunity:
@@ -46,19 +64,7 @@ class HubSpotIngestor:
         """
         deal = self.client.crm.deals.basic_api.get_by_id(
             deal_id=deal_id,
-            properties=[
-                "dealname",
-                "company",
-                "goal",
-                "persona",
-                "deadline",
-                "budget",
-                "must_have_features",
-                "references",
-                "constraints",
-                "has_copy",
-                "has_photos",
-            ],
+            properties=_DEAL_PROPERTIES,
         )
 
         return self._parse_deal(deal)
@@ -110,35 +116,39 @@ class HubSpotIngestor:
 
         search_request = {
             "filterGroups": filter_groups,
-            "properties": [
-                "dealname",
-                "company",
-                "goal",
-                "persona",
-                "deadline",
-                "budget",
-                "must_have_features",
-                "references",
-                "constraints",
-                "has_copy",
-                "has_photos",
-            ],
-            "limit": limit,
+            "properties": _DEAL_PROPERTIES,
         }
 
-        results = self.client.crm.deals.search_api.do_search(
-            public_object_search_request=search_request
-        )
-
+        # Follow the ``after`` cursor, fetching page N+1 in the background
+        # while page N is parsed.
         opportunities = []
-        for deal in results.results:
-            try:
-                opportunities.append(self._parse_deal(deal))
-            except Exception as exc:
-                logger.warning(
-                    f"Failed to parse HubSpot deal {deal.id}: {exc}",
-                    exc_info=True,
-                )
+        fetched = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending: Future | None = executor.submit(
+                self._search_page, search_request, min(limit, _PAGE_SIZE), None
+            )
+            while pending is not None:
+                results = pending.result()
+                deals = results.results
+                fetched += len(deals)
+                after = self._next_after(results)
+                pending = None
+                if after and deals and fetched < limit:
+                    pending = executor.submit(
+                        self._search_page,
+                        search_request,
+                        min(limit - fetched, _PAGE_SIZE),
+                        after,
+                    )
+
+                for deal in deals:
+                    try:
+                        opportunities.append(self._parse_deal(deal))
+                    except Exception as exc:
+                        logger.warning(
+                            f"Failed to parse HubSpot deal {deal.id}: {exc}",
+                            exc_info=True,
+                        )
 
         logger.info(
             f"Fetched {len(opportunities)} opportunities from HubSpot",
@@ -147,6 +157,32 @@ class HubSpotIngestor:
 
         return opportunities
 
+    def _search_page(
+        self, search_request: dict[str, Any], limit: int, after: str | None
+    ) -> Any:
+        """Fetch one page of deal search results.
+
+        Args:
+            search_request: Search request without paging fields
+            limit: Page size
+            after: Paging cursor from the previous page, if any
+
+        Returns:
+            HubSpot search response
+        """
+        request = {**search_request, "limit": limit}
+        if after:
+            request["after"] = after
+        return self.client.crm.deals.search_api.do_search(
+            public_object_search_request=request
+        )
+
+    def _next_after(self, results: Any) -> str | None:
+        """Return the cursor for the next page, or None on the last page."""
+        paging = getattr(results, "paging", None)
+        next_page = getattr(paging, "next", None) if paging else None
+        return getattr(next_page, "after", None) if next_page else None
+
     def _parse_deal(self, deal: Any) -> Opportunity:
         """Parse a HubSpot deal into an Opportunity.
 
@@ -156,40 +192,48 @@ class HubSpotIngestor:
         Returns:
             Opportunity instance
         """
-        props = deal.properties
+        get = deal.properties.get
 
         # Parse multi-value fields
-        must_have = self._parse_list(props.get("must_have_features", ""))
-        references = self._parse_list(props.get("references", ""))
-        constraints = self._parse_list(props.get("constraints", ""))
+        must_have = self._parse_list(get("must_have_features", ""))
+        references = self._parse_list(get("references", ""))
+        constraints = self._parse_list(get("constraints", ""))
 
         # Parse date
         deadline = None
-        if props.get("deadline"):
+        raw_deadline = get("deadline")
+        if raw_deadline:
             try:
-                deadline = datetime.fromisoformat(props["deadline"]).date()
+                deadline = datetime.fromisoformat(raw_deadline).date()
             except Exception:
                 pass
 
         # Parse assets
         assets = {
-            "copy": props.get("has_copy", "false").lower() == "true",
-            "photo": props.get("has_photos", "false").lower() == "true",
+            "copy": get("has_copy") in _TRUTHY,
+            "photo": get("has_photos") in _TRUTHY,
         }
 
-        return Opportunity(
-            id=deal.id,
-            title=props.get("dealname", ""),
-            company=props.get("company", ""),
-            goal=props.get("goal", ""),
-            persona=props.get("persona"),
-            deadline=deadline,
-            budget_band=props.get("budget"),
-            must_have=must_have,
-            references=references,
-            constraints=constraints,
-            assets=assets,
-        )
+        payload = {
+            "id": deal.id,
+            "title": get("dealname", ""),
+            "company": get("company", ""),
+            "goal": get("goal", ""),
+            "persona": get("persona"),
+            "deadline": deadline,
+            "budget_band": get("budget"),
+            "must_have": must_have,
+            "references": references,
+            "constraints": constraints,
+        }
+
+        # HubSpot reports unset properties as None; only skip validation once
+        # the required text fields are known to be strings.
+        if all(isinstance(payload[name], str) for name in _REQUIRED_TEXT_FIELDS):
+            return Opportunity.model_construct(
+                **payload, assets=OpportunityAssets.model_construct(**assets)
+            )
+        return Opportunity(**payload, assets=assets)
 
     def _parse_list(self, value: str) -> list[str]:
         """Parse semicolon-separated list from HubSpot property.
@@ -214,10 +258,7 @@ class HubSpotIngestor:
         Returns:
             Secret value
         """
-        client = secretmanager.SecretManagerServiceClient()
-        name = f"projects/{project_id}/secrets/{secret_id}/versions/latest"
-        response = client.access_secret_version(name=name)
-        return response.payload.data.decode("UTF-8")
+        return access_secret(project_id, secret_id)
 
 
 __all__ = ["HubSpotIngestor"]
@@ -2,16 +2,36 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
 from typing import Any
 
-from google.cloud import secretmanager
-from notion_client import Client
-
-from ..models.opportunity import Opportunity
+from ..models.opportunity import Opportunity, OpportunityAssets
+from ..secret_manager import access_secret
 
 logger = logging.getLogger(__name__)
 
+# Notion's database query API returns at most 100 pages per request.
+_PAGE_SIZE = 100
+_REQUIRED_TEXT_FIELDS = ("id", "title", "company", "goal")
+_EMPTY: dict[str, Any] = {}
+
+# Opportunity field -> (Notion property, property type). Adjust property names
+# based on your actual Notion database schema.
+_TEXT_PROPERTIES = (
+    ("id", "ID", "rich_text"),
+    ("title", "案件名", "title"),
+    ("company", "会社名", "rich_text"),
+    ("goal", "目的", "rich_text"),
+    ("persona", "ペルソナ", "rich_text"),
+    ("budget_band", "予算感", "rich_text"),
+)
+_MULTI_SELECT_PROPERTIES = (
+    ("must_have", "必須要件"),
+    ("references", "参考事例"),
+    ("constraints", "制約条件"),
+)
+
 
 class NotionIngestor:
     """Ingestor for Notion database opportunities."""
@@ -36,6 +56,8 @@ class NotionIngestor:
         if not api_key and project_id:
             api_key = self._get_secret(project_id, "notion-api-key")
 
+        from notion_client import Client
+
         self.client = Client(auth=api_key)
 
     def get_opportunity(self, page_id: str) -> Opportunity:
@@ -73,19 +95,36 @@ class NotionIngestor:
                 "select": {"equals": status_filter},
             }
 
-        query_params["page_size"] = min(limit, 100)
-
-        results = self.client.databases.query(**query_params)
-
+        # Follow ``next_cursor``, fetching batch N+1 in the background while
+        # batch N is parsed.
         opportunities = []
-        for page in results.get("results", []):
-            try:
-                opportunities.append(self._parse_page(page))
-            except Exception as exc:
-                logger.warning(
-                    f"Failed to parse Notion page {page.get('id')}: {exc}",
-                    exc_info=True,
-                )
+        fetched = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending: Future | None = executor.submit(
+                self._query_page, query_params, min(limit, _PAGE_SIZE), None
+            )
+            while pending is not None:
+                results = pending.result()
+                pages = results.get("results", [])
+                fetched += len(pages)
+                cursor = results.get("next_cursor") if results.get("has_more") else None
+                pending = None
+                if cursor and pages and fetched < limit:
+                    pending = executor.submit(
+                        self._query_page,
+                        query_params,
+                        min(limit - fetched, _PAGE_SIZE),
+                        cursor,
+                    )
+
+                for page in pages:
+                    try:
+                        opportunities.append(self._parse_page(page))
+                    except Exception as exc:
+                        logger.warning(
+                            f"Failed to parse Notion page {page.get('id')}: {exc}",
+                            exc_info=True,
+                        )
 
         logger.info(
             f"Fetched {len(opportunities)} opportunities from Notion",
@@ -94,6 +133,24 @@ class NotionIngestor:
 
         return opportunities
 
+    def _query_page(
+        self, query_params: dict[str, Any], page_size: int, start_cursor: str | None
+    ) -> dict[str, Any]:
+        """Fetch one batch of database query results.
+
+        Args:
+            query_params: Query parameters without paging fields
+            page_size: Batch size
+            start_cursor: Cursor from the previous batch, if any
+
+        Returns:
+            Notion query response
+        """
+        params = {**query_params, "page_size": page_size}
+        if start_cursor:
+            params["start_cursor"] = start_cursor
+        return self.client.databases.query(**params)
+
     def _parse_page(self, page: dict[str, Any]) -> Opportunity:
         """Parse a Notion page into an Opportunity.
 
@@ -103,50 +160,33 @@ class NotionIngestor:
         Returns:
             Opportunity instance
         """
-        props = page.get("properties", {})
+        get = page.get("properties", _EMPTY).get
 
         # Extract fields from Notion properties
-        # Adjust property names based on your actual Notion database schema
-        opportunity_id = self._get_rich_text(props.get("ID", {}))
-        title = self._get_title(props.get("案件名", {}))
-        company = self._get_rich_text(props.get("会社名", {}))
-        goal = self._get_rich_text(props.get("目的", {}))
-        persona = self._get_rich_text(props.get("ペルソナ", {}))
-        deadline = self._get_date(props.get("納期", {}))
-        budget_band = self._get_rich_text(props.get("予算感", {}))
-        must_have = self._get_multi_select(props.get("必須要件", {}))
-        references = self._get_multi_select(props.get("参考事例", {}))
-        constraints = self._get_multi_select(props.get("制約条件", {}))
+        payload: dict[str, Any] = {}
+        for field, name, kind in _TEXT_PROPERTIES:
+            texts = (get(name) or _EMPTY).get(kind)
+            payload[field] = texts[0].get("plain_text", "") if texts else ""
+        payload["id"] = payload["id"] or page["id"]
+        payload["deadline"] = self._get_date(get("納期") or _EMPTY)
+        for field, name in _MULTI_SELECT_PROPERTIES:
+            payload[field] = [opt["name"] for opt in (get(name) or _EMPTY).get("multi_select", ())]
 
         # Parse assets (copy/photo availability)
         assets = {
-            "copy": self._get_checkbox(props.get("コピー提供", {})),
-            "photo": self._get_checkbox(props.get("写真素材提供", {})),
+            "copy": (get("コピー提供") or _EMPTY).get("checkbox", False),
+            "photo": (get("写真素材提供") or _EMPTY).get("checkbox", False),
         }
 
-        return Opportunity(
-            id=opportunity_id or page["id"],
-            title=title,
-            company=company,
-            goal=goal,
-            persona=persona,
-            deadline=deadline,
-            budget_band=budget_band,
-            must_have=must_have,
-            references=references,
-            constraints=constraints,
-            assets=assets,
-        )
-
-    def _get_title(self, prop: dict[str, Any]) -> str:
-        """Extract title from Notion property."""
-        titles = prop.get("title", [])
-        return titles[0].get("plain_text", "") if titles else ""
-
-    def _get_rich_text(self, prop: dict[str, Any]) -> str:
-        """Extract rich text from Notion property."""
-        texts = prop.get("rich_text", [])
-        return texts[0].get("plain_text", "") if texts else ""
+        # The property reads above already yield typed values; skip validation
+        # unless a malformed row slipped a non-string into a required field.
+        if all(isinstance(payload[name], str) for name in _REQUIRED_TEXT_FIELDS) and all(
+            isinstance(value, bool) for value in assets.values()
+        ):
+            return Opportunity.model_construct(
+                **payload, assets=OpportunityAssets.model_construct(**assets)
+            )
+        return Opportunity(**payload, assets=assets)
 
     def _get_date(self, prop: dict[str, Any]) -> date | None:
         """Extract date from Notion property."""
@@ -164,15 +204,6 @@ class NotionIngestor:
         except Exception:
             return None
 
-    def _get_multi_select(self, prop: dict[str, Any]) -> list[str]:
-        """Extract multi-select values from Notion property."""
-        options = prop.get("multi_select", [])
-        return [opt.get("name", "") for opt in options]
-
-    def _get_checkbox(self, prop: dict[str, Any]) -> bool:
-        """Extract checkbox value from Notion property."""
-        return prop.get("checkbox", False)
-
     def _get_secret(self, project_id: str, secret_id: str) -> str:
         """Fetch secret from Secret Manager.
 
@@ -183,10 +214,7 @@ class NotionIngestor:
         Returns:
             Secret value
         """
-        client = secretmanager.SecretManagerServiceClient()
-        name = f"projects/{project_id}/secrets/{secret_id}/versions/latest"
-        response = client.access_secret_version(name=name)
-        return response.payload.data.decode("UTF-8")
+        return access_secret(project_id, secret_id)
 
 
 __all__ = ["NotionIngestor"]
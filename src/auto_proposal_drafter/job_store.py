@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import secrets
 import threading
-import uuid
+import time
 from datetime import datetime
 from typing import Dict
 
@@ -11,6 +12,7 @@ from .models.job import JobOutputs, JobRecord, JobStatus
 class JobStore:
     def __init__(self) -> None:
         self._jobs: Dict[str, JobRecord] = {}
+        self._job_locks: Dict[str, threading.Lock] = {}
         self._lock = threading.Lock()
 
     def create_job(self, *, source: str, record_id: str | None, priority: str | None) -> JobRecord:
@@ -23,12 +25,13 @@ class JobStore:
                 record_id=record_id,
                 priority=priority,
             )
+            self._job_locks[job_id] = threading.Lock()
             self._jobs[job_id] = job
             return job
 
     def get_job(self, job_id: str) -> JobRecord | None:
-        with self._lock:
-            return self._jobs.get(job_id)
+        # dict.get is atomic under the GIL; readers never wait on writers.
+        return self._jobs.get(job_id)
 
     def update_job(
         self,
@@ -38,27 +41,29 @@ class JobStore:
         progress: float | None = None,
         outputs: JobOutputs | None = None,
         errors: list[str] | None = None,
-    ) -> JobRecord:
-        with self._lock:
-            job = self._jobs[job_id]
-            if status is not None:
-                job.status = status
-            if progress is not None:
-                job.progress = progress
-            if outputs is not None:
-                job.outputs = outputs
-            if errors is not None:
-                job.errors = list(errors)
-            job.updated_at = datetime.utcnow()
-            self._jobs[job_id] = job
-            return job
+    ) -> None:
+        update: dict[str, object] = {"updated_at": datetime.utcnow()}
+        if status is not None:
+            # model_copy skips validation, so store the plain string that the
+            # JobStatusLiteral field holds after create_job.
+            update["status"] = status.value
+        if progress is not None:
+            update["progress"] = progress
+        if outputs is not None:
+            update["outputs"] = outputs
+        if errors is not None:
+            update["errors"] = list(errors)
+        # Copy-on-write: readers holding the previous record keep a consistent
+        # snapshot, and model_copy skips validation of the untouched fields.
+        with self._job_locks[job_id]:
+            self._jobs[job_id] = self._jobs[job_id].model_copy(update=update)
 
     def _generate_id(self, record_id: str | None) -> str:
-        ts = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        suffix = uuid.uuid4().hex[:6]
+        suffix = secrets.token_hex(3)
         if record_id:
             safe = record_id.replace("/", "-")
             return f"job_{safe}_{suffix}"
+        ts = time.strftime("%Y%m%d%H%M%S", time.gmtime())
         return f"job_{ts}_{suffix}"
 
 
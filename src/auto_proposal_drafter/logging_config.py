@@ -2,24 +2,38 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from contextvars import ContextVar
 from typing import Any
 
-from google.cloud import logging as cloud_logging
+import orjson
 
 # Context variable for trace ID
 trace_id_var: ContextVar[str | None] = ContextVar("trace_id", default=None)
 
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging compatible with Cloud Logging."""
 
-    def format(self, record: logging.LogRecord) -> str:
-        import json
-        from datetime import datetime
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted prefix), replaced as a single tuple so
+        # records formatted from different threads never see a torn pair.
+        self._second_cache: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime(_TIMESTAMP_FORMAT, time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
 
+    def format(self, record: logging.LogRecord) -> str:
         log_obj = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "severity": record.levelname,
             "message": record.getMessage(),
             "logger": record.name,
@@ -41,7 +55,7 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_obj["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_obj)
+        return orjson.dumps(log_obj, default=str).decode()
 
 
 def setup_logging(
@@ -61,6 +75,8 @@ def setup_logging(
 
     if use_cloud_logging and project_id and environment != "dev":
         # Use Cloud Logging client
+        from google.cloud import logging as cloud_logging
+
         client = cloud_logging.Client(project=project_id)
         client.setup_logging(log_level=log_level)
     else:
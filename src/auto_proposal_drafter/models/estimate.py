@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from typing import Sequence
+import math
+import operator
+from functools import cached_property
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+
+_get_cost = operator.attrgetter("cost")
+_get_multiplier = operator.attrgetter("multiplier")
 
 
 class EstimateLineItem(BaseModel):
@@ -13,7 +19,12 @@ class EstimateLineItem(BaseModel):
     role: str
     notes: str | None = None
 
-    @property
+    # Frozen so the cached cost can never drift from its inputs. Build a new
+    # item rather than model_copy(update=...), which would carry the cache over.
+    model_config = {"frozen": True}
+
+    @computed_field
+    @cached_property
     def cost(self) -> float:
         return round(self.qty * self.hours * self.rate, 2)
 
@@ -25,10 +36,19 @@ class EstimateCoefficient(BaseModel):
 
 
 class EstimateDraft(BaseModel):
-    line_items: Sequence[EstimateLineItem]
-    coefficients: Sequence[EstimateCoefficient] = Field(default_factory=list)
-    assumptions: Sequence[str] = Field(default_factory=list)
+    line_items: list[EstimateLineItem]
+    coefficients: list[EstimateCoefficient] = Field(default_factory=list)
+    assumptions: list[str] = Field(default_factory=list)
     currency: str = "JPY"
 
+    def totals(self) -> tuple[float, float]:
+        """Return the base total and the total after all coefficients.
+
+        ``math.prod`` with ``start`` multiplies left to right, so the result is
+        bit-for-bit the same as applying each coefficient in turn.
+        """
+        total_base = sum(map(_get_cost, self.line_items))
+        return total_base, math.prod(map(_get_multiplier, self.coefficients), start=total_base)
+
 
 __all__ = ["EstimateDraft", "EstimateLineItem", "EstimateCoefficient"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Mapping, Sequence
+from typing import Any, Literal, Mapping
 
 from pydantic import BaseModel, Field
 
@@ -14,6 +14,11 @@ class JobStatus(str, Enum):
     failed = "FAILED"
 
 
+# JobRecord validates status against plain string literals, which is cheaper
+# than the enum validator; JobStatus members are str and still pass.
+JobStatusLiteral = Literal["QUEUED", "IN_PROGRESS", "COMPLETED", "FAILED"]
+
+
 class JobOutputs(BaseModel):
     notion_url: str | None = None
     figma_wire_json_url: str | None = None
@@ -27,15 +32,15 @@ class JobOutputs(BaseModel):
 
 class JobRecord(BaseModel):
     id: str
-    status: JobStatus
+    status: JobStatusLiteral
     progress: float = 0.0
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     source: str | None = None
     record_id: str | None = None
     priority: str | None = None
-    errors: Sequence[str] = Field(default_factory=list)
+    errors: list[str] = Field(default_factory=list)
     outputs: JobOutputs = Field(default_factory=JobOutputs)
 
 
-__all__ = ["JobRecord", "JobStatus", "JobOutputs"]
+__all__ = ["JobRecord", "JobStatus", "JobStatusLiteral", "JobOutputs"]
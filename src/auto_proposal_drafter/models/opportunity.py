@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Literal, Sequence
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -19,20 +19,19 @@ class Opportunity(BaseModel):
     company: str
     title: str
     goal: str
-    kpi: Sequence[str] = Field(default_factory=list)
+    kpi: list[str] = Field(default_factory=list)
     deadline: date | None = None
     budget_band: str | None = None
     persona: str | None = None
-    must_have: Sequence[str] = Field(default_factory=list, alias="must_have")
-    references: Sequence[str] = Field(default_factory=list)
-    constraints: Sequence[str] = Field(default_factory=list)
+    must_have: list[str] = Field(default_factory=list)
+    references: list[str] = Field(default_factory=list)
+    constraints: list[str] = Field(default_factory=list)
     assets: OpportunityAssets = Field(default_factory=OpportunityAssets)
     notes: str | None = None
     created_by: str | None = None
     source: Literal["notion", "slack", "manual", "hubspot", "unknown"] = "unknown"
 
     class Config:
-        populate_by_name = True
         json_schema_extra = {
             "example": {
                 "id": "OPP-2025-001",
@@ -1,30 +1,33 @@
 from __future__ import annotations
 
-from typing import Sequence
-
 from pydantic import BaseModel, Field
 
 
 class SectionSpec(BaseModel):
     kind: str
     variant: str
-    copy: Sequence[str] | None = None
-    notes: Sequence[str] | None = None
+    copy: list[str] | None = None
+    notes: list[str] | None = None
+
+    # Preset specs are shared across requests; derive variants with model_copy
+    model_config = {"frozen": True}
 
 
 class SitePageSpec(BaseModel):
     page_id: str
     type: str = Field(default="LP")
     goal: str | None = None
-    sections: Sequence[SectionSpec] = Field(default_factory=list)
-    notes: Sequence[str] | None = None
+    sections: list[SectionSpec] = Field(default_factory=list)
+    notes: list[str] | None = None
+
+    model_config = {"frozen": True}
 
 
 class StructureDraft(BaseModel):
-    site_map: Sequence[SitePageSpec]
-    flows: Sequence[str]
-    uncertains: Sequence[str] = Field(default_factory=list)
-    risks: Sequence[str] = Field(default_factory=list)
+    site_map: list[SitePageSpec]
+    flows: list[str]
+    uncertains: list[str] = Field(default_factory=list)
+    risks: list[str] = Field(default_factory=list)
 
 
 __all__ = ["SectionSpec", "SitePageSpec", "StructureDraft"]
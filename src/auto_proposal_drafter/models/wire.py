@@ -1,31 +1,34 @@
 from __future__ import annotations
 
-from typing import Mapping, Sequence
+from typing import Mapping
 
 from pydantic import BaseModel, Field
+from typing_extensions import NotRequired, TypedDict
 
 
-class WireProject(BaseModel):
+# Leaf types are TypedDicts: the parent models validate them as plain dicts
+# without building a BaseModel instance per project/section.
+class WireProject(TypedDict):
     id: str
     title: str
 
 
-class WireSection(BaseModel):
+class WireSection(TypedDict):
     kind: str
     variant: str
-    placeholders: Mapping[str, str] | None = None
+    placeholders: NotRequired[Mapping[str, str] | None]
 
 
 class WirePage(BaseModel):
     page_id: str
-    sections: Sequence[WireSection] = Field(default_factory=list)
-    notes: Sequence[str] | None = None
+    sections: list[WireSection] = Field(default_factory=list)
+    notes: list[str] | None = None
 
 
 class WireDraft(BaseModel):
     project: WireProject
-    frames: Sequence[str] = Field(default_factory=lambda: ["Desktop", "Tablet", "Mobile"])
-    pages: Sequence[WirePage]
+    frames: list[str] = Field(default_factory=lambda: ["Desktop", "Tablet", "Mobile"])
+    pages: list[WirePage]
 
 
 __all__ = ["WireDraft", "WirePage", "WireProject", "WireSection"]
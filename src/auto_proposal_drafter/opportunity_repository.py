@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Protocol
 
+from pydantic import TypeAdapter
+
 from .models.opportunity import Opportunity
 
+_OPP_ADAPTER = TypeAdapter(Opportunity)
+
+
+@lru_cache(maxsize=256)
+def _load(path: str, mtime_ns: int) -> Opportunity:
+    """Read and validate a payload; ``mtime_ns`` keys the cache so edits are picked up."""
+    return _OPP_ADAPTER.validate_json(Path(path).read_bytes())
+
 
 class OpportunityRepository(Protocol):
     def get(self, *, source: str, record_id: str) -> Opportunity:
@@ -17,12 +27,18 @@ class LocalOpportunityRepository:
         self._base_path = base_path
 
     def get(self, *, source: str, record_id: str) -> Opportunity:
+        """Load an opportunity payload from ``<base_path>/<record_id>.json``.
+
+        Parsed payloads are cached per file path and modification time, so
+        the returned instance is shared between callers and must not be
+        mutated.
+        """
         file_path = self._base_path / f"{record_id}.json"
-        if not file_path.exists():
-            raise FileNotFoundError(f"Opportunity payload not found: {file_path}")
-        with file_path.open("r", encoding="utf-8") as fp:
-            data = json.load(fp)
-        return Opportunity.model_validate(data)
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Opportunity payload not found: {file_path}") from None
+        return _load(str(file_path), mtime_ns)
 
 
 __all__ = ["OpportunityRepository", "LocalOpportunityRepository"]
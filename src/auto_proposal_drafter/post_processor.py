@@ -1,22 +1,83 @@
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import asana
 import gspread
 from google.auth import default
-from google.cloud import secretmanager
 from notion_client import Client
+from pydantic import TypeAdapter
 
 from .models.estimate import EstimateDraft
 from .models.structure import StructureDraft
 from .models.wire import WireDraft
+from .secret_manager import access_secret
 
 logger = logging.getLogger(__name__)
 
+_WIRE_ADAPTER = TypeAdapter(WireDraft)
+
+_STEP_LOG_MESSAGES = {
+    "notion_url": "Updated Notion page",
+    "sheets_url": "Created estimate sheet",
+    "figma_url": "Generated Figma feed",
+}
+
+# Notion rejects rich_text segments longer than this many characters.
+_NOTION_TEXT_LIMIT = 2000
+
+# Static Notion block skeleton; the client only serializes it, never mutates it.
+_SUMMARY_HEADING_BLOCK: dict[str, Any] = {
+    "object": "block",
+    "type": "heading_2",
+    "heading_2": {"rich_text": [{"type": "text", "text": {"content": "提案サマリ"}}]},
+}
+
+
+@dataclass(slots=True)
+class DraftOutputs:
+    """Output URLs collected while distributing a draft."""
+
+    notion_url: str | None = None
+    sheets_url: str | None = None
+    figma_url: str | None = None
+    asana_url: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, str]:
+        """Return the populated fields, in declaration order."""
+        return {
+            name: value
+            for name in _DRAFT_OUTPUT_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+
+_DRAFT_OUTPUT_FIELDS = tuple(field.name for field in fields(DraftOutputs))
+
+
+def _make_code_block(summary: str) -> dict[str, Any]:
+    """Return a Notion markdown code block holding ``summary``.
+
+    Long summaries are split into consecutive rich_text segments so each one
+    stays within Notion's per-segment limit; the block still renders as one.
+    """
+    return {
+        "object": "block",
+        "type": "code",
+        "code": {
+            "rich_text": [
+                {"type": "text", "text": {"content": summary[start : start + _NOTION_TEXT_LIMIT]}}
+                for start in range(0, max(len(summary), 1), _NOTION_TEXT_LIMIT)
+            ],
+            "language": "markdown",
+        },
+    }
+
 
 class PostProcessor:
     """Post-processing service for distributing draft outputs."""
@@ -81,60 +142,86 @@ class PostProcessor:
             Dictionary of output URLs
         """
         options = options or {}
-        outputs = {}
+        outputs = DraftOutputs()
+        now = datetime.now(timezone.utc)
+
+        # Notion, Sheets and Figma are independent network-bound steps; run
+        # them concurrently and collect results in a fixed order.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            pending: dict[str, Future[str]] = {}
 
-        try:
             # Update Notion page if configured
             if self.notion_client and options.get("notion_page_id"):
-                notion_url = self._update_notion_page(
+                pending["notion_url"] = executor.submit(
+                    self._update_notion_page,
                     page_id=options["notion_page_id"],
                     structure=structure,
                     estimate=estimate,
                     summary=summary,
+                    proposed_at=now.isoformat(),
                 )
-                outputs["notion_url"] = notion_url
-                logger.info(f"Updated Notion page: {notion_url}")
 
             # Create/update Google Sheets if configured
             if options.get("sheets_template_id"):
-                sheets_url = self._create_estimate_sheet(
+                pending["sheets_url"] = executor.submit(
+                    self._create_estimate_sheet,
                     template_id=options["sheets_template_id"],
                     job_id=job_id,
                     estimate=estimate,
                 )
-                outputs["sheets_url"] = sheets_url
-                logger.info(f"Created estimate sheet: {sheets_url}")
 
             # Generate Figma plugin feed (signed URL or Cloud Storage)
-            figma_url = self._generate_figma_feed(
+            pending["figma_url"] = executor.submit(
+                self._generate_figma_feed,
                 job_id=job_id,
                 wire=wire,
             )
-            outputs["figma_url"] = figma_url
-            logger.info(f"Generated Figma feed: {figma_url}")
 
-            # Create Asana task if configured
-            if self.asana_client and options.get("asana_project_gid"):
+            for key, future in pending.items():
+                try:
+                    url = future.result()
+                    setattr(outputs, key, url)
+                    logger.info(f"{_STEP_LOG_MESSAGES[key]}: {url}")
+                except Exception as exc:
+                    self._record_failure(outputs, job_id, key, exc)
+
+        # Create Asana task if configured; it links whatever outputs succeeded
+        if self.asana_client and options.get("asana_project_gid"):
+            try:
                 asana_url = self._create_asana_task(
                     project_gid=options["asana_project_gid"],
                     job_id=job_id,
                     record_id=record_id,
                     summary=summary,
-                    outputs=outputs,
+                    outputs=outputs.to_dict(),
+                    due_on=(now.date() + timedelta(days=3)).isoformat(),
                 )
-                outputs["asana_url"] = asana_url
+                outputs.asana_url = asana_url
                 logger.info(f"Created Asana task: {asana_url}")
+            except Exception as exc:
+                self._record_failure(outputs, job_id, "asana_url", exc)
 
-        except Exception as exc:
-            logger.error(
-                "Failed to process draft outputs",
-                exc_info=True,
-                extra={"job_id": job_id, "error": str(exc)},
-            )
-            # Don't raise - partial success is acceptable
-            outputs["error"] = str(exc)
+        return outputs.to_dict()
 
-        return outputs
+    def _record_failure(
+        self, outputs: DraftOutputs, job_id: str, step: str, exc: Exception
+    ) -> None:
+        """Log a failed distribution step and keep the first error message.
+
+        Args:
+            outputs: Outputs being assembled
+            job_id: Job ID
+            step: Output key of the failed step
+            exc: Raised exception
+        """
+        logger.error(
+            "Failed to process draft outputs",
+            exc_info=exc,
+            extra={"job_id": job_id, "step": step, "error": str(exc)},
+        )
+        # Don't raise - partial success is acceptable
+        if outputs.error is None:
+            outputs.error = str(exc)
 
     def _update_notion_page(
         self,
@@ -143,6 +230,7 @@ class PostProcessor:
         structure: StructureDraft,
         estimate: EstimateDraft,
         summary: str,
+        proposed_at: str,
     ) -> str:
         """Update Notion page with draft results.
 
@@ -151,15 +239,13 @@ class PostProcessor:
             structure: Structure draft
             estimate: Estimate draft
             summary: Summary markdown
+            proposed_at: Proposal timestamp (ISO 8601, UTC)
 
         Returns:
             Notion page URL
         """
         # Calculate total estimate
-        total_base = sum(item.cost for item in estimate.line_items)
-        total = total_base
-        for coeff in estimate.coefficients:
-            total *= coeff.multiplier
+        _, total = estimate.totals()
 
         # Update page properties
         self.notion_client.pages.update(
@@ -167,30 +253,14 @@ class PostProcessor:
             properties={
                 "見積金額": {"number": int(total)},
                 "ステータス": {"select": {"name": "提案済み"}},
-                "提案日": {"date": {"start": datetime.utcnow().isoformat()}},
+                "提案日": {"date": {"start": proposed_at}},
             },
         )
 
         # Add summary as page content
         self.notion_client.blocks.children.append(
             block_id=page_id,
-            children=[
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": "提案サマリ"}}]
-                    },
-                },
-                {
-                    "object": "block",
-                    "type": "code",
-                    "code": {
-                        "rich_text": [{"type": "text", "text": {"content": summary}}],
-                        "language": "markdown",
-                    },
-                },
-            ],
+            children=[_SUMMARY_HEADING_BLOCK, _make_code_block(summary)],
         )
 
         return f"https://notion.so/{page_id.replace('-', '')}"
@@ -219,32 +289,40 @@ class PostProcessor:
         # Get first worksheet
         worksheet = new_sheet.sheet1
 
-        # Write line items starting from row 3 (assuming template has header)
+        # Collect every range and write them in one batch_update round-trip.
+        # Line items start from row 3 (assuming template has header).
+        updates = []
         row = 3
-        for item in estimate.line_items:
-            worksheet.update(
-                f"A{row}:E{row}",
-                [[item.item, item.qty, item.hours, item.rate, item.cost]],
+        line_rows = [
+            [item.item, item.qty, item.hours, item.rate, item.cost]
+            for item in estimate.line_items
+        ]
+        if line_rows:
+            updates.append(
+                {"range": f"A{row}:E{row + len(line_rows) - 1}", "values": line_rows}
             )
-            row += 1
+        row += len(line_rows)
 
         # Calculate totals
-        total_base = sum(item.cost for item in estimate.line_items)
-        total = total_base
+        _, total = estimate.totals()
 
-        # Write coefficients
+        # Coefficients
         row += 2
-        for coeff in estimate.coefficients:
-            worksheet.update(
-                f"A{row}:C{row}",
-                [[coeff.name, f"×{coeff.multiplier:.2f}", coeff.reason]],
+        coeff_rows = [
+            [coeff.name, f"×{coeff.multiplier:.2f}", coeff.reason]
+            for coeff in estimate.coefficients
+        ]
+        if coeff_rows:
+            updates.append(
+                {"range": f"A{row}:C{row + len(coeff_rows) - 1}", "values": coeff_rows}
             )
-            total *= coeff.multiplier
-            row += 1
+        row += len(coeff_rows)
 
-        # Write final total
+        # Final total
         row += 1
-        worksheet.update(f"A{row}:B{row}", [["最終見積", f"¥{int(total):,}"]])
+        updates.append({"range": f"A{row}:B{row}", "values": [["最終見積", f"¥{int(total):,}"]]})
+
+        worksheet.batch_update(updates)
 
         return new_sheet.url
 
@@ -265,16 +343,15 @@ class PostProcessor:
         """
         from google.cloud import storage
 
-        feed_json = wire.model_dump()
+        # Serialize straight to UTF-8 bytes in one pydantic-core pass; no
+        # intermediate str copy is held alongside the upload body.
+        payload = _WIRE_ADAPTER.dump_json(wire, indent=2)
 
         # Upload to Cloud Storage
         storage_client = storage.Client(project=self.project_id)
         bucket = storage_client.bucket(f"{self.project_id}-figma-feeds")
         blob = bucket.blob(f"{job_id}/wire.json")
-        blob.upload_from_string(
-            json.dumps(feed_json, ensure_ascii=False, indent=2),
-            content_type="application/json"
-        )
+        blob.upload_from_string(payload, content_type="application/json")
 
         # Generate signed URL valid for 7 days
         url = blob.generate_signed_url(expiration=timedelta(days=7))
@@ -291,6 +368,7 @@ class PostProcessor:
         record_id: str,
         summary: str,
         outputs: dict[str, str],
+        due_on: str,
     ) -> str:
         """Create Asana task for draft review.
 
@@ -300,17 +378,19 @@ class PostProcessor:
             record_id: Original record ID
             summary: Summary markdown
             outputs: Output URLs
+            due_on: Review due date (ISO 8601)
 
         Returns:
             Asana task URL
         """
         # Build task notes with output links
-        notes_parts = [summary, "\n\n## アウトプット"]
-        for key, url in outputs.items():
-            if key != "error":
-                notes_parts.append(f"- {key}: {url}")
-
-        notes = "\n".join(notes_parts)
+        notes = "\n".join(
+            [
+                summary,
+                "\n\n## アウトプット",
+                *[f"- {key}: {url}" for key, url in outputs.items() if key != "error"],
+            ]
+        )
 
         # Create task
         result = self.asana_client.tasks.create(
@@ -318,7 +398,7 @@ class PostProcessor:
                 "projects": [project_gid],
                 "name": f"提案レビュー: {record_id}",
                 "notes": notes,
-                "due_on": (datetime.utcnow().date() + timedelta(days=3)).isoformat(),
+                "due_on": due_on,
             }
         )
 
@@ -337,10 +417,7 @@ class PostProcessor:
             Secret value or None if not found
         """
         try:
-            client = secretmanager.SecretManagerServiceClient()
-            name = f"projects/{self.project_id}/secrets/{secret_id}/versions/latest"
-            response = client.access_secret_version(name=name)
-            return response.payload.data.decode("UTF-8")
+            return access_secret(self.project_id, secret_id)
         except Exception as exc:
             logger.warning(
                 f"Failed to fetch secret {secret_id}: {exc}",
@@ -349,7 +426,4 @@ class PostProcessor:
             return None
 
 
-# Missing import
-from datetime import timedelta
-
 __all__ = ["PostProcessor"]
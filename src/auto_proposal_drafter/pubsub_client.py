@@ -1,20 +1,38 @@
 from __future__ import annotations
 
-import json
+import functools
 import logging
+from concurrent.futures import Future
 from typing import Any
 
+import orjson
 from google.cloud import pubsub_v1
 
 logger = logging.getLogger(__name__)
 
+# Coalesce concurrent publishes into shared RPCs. The API awaits draft-request
+# publishes before responding, so keep the added latency to 10 ms.
+DEFAULT_BATCH_SETTINGS = pubsub_v1.types.BatchSettings(
+    max_messages=100,
+    max_bytes=1024 * 1024,
+    max_latency=0.01,
+)
+
 
 class PubSubClient:
     """Wrapper for Google Cloud Pub/Sub operations."""
 
-    def __init__(self, project_id: str) -> None:
+    def __init__(
+        self,
+        project_id: str,
+        *,
+        batch_settings: pubsub_v1.types.BatchSettings | None = None,
+    ) -> None:
         self.project_id = project_id
-        self.publisher = pubsub_v1.PublisherClient()
+        self.publisher = pubsub_v1.PublisherClient(
+            batch_settings=batch_settings or DEFAULT_BATCH_SETTINGS
+        )
+        self._topic_paths: dict[str, str] = {}
 
     def publish(
         self,
@@ -23,7 +41,7 @@ class PubSubClient:
         *,
         attributes: dict[str, str] | None = None,
     ) -> str:
-        """Publish a message to a Pub/Sub topic.
+        """Publish a message to a Pub/Sub topic and wait for the message ID.
 
         Args:
             topic_id: The topic ID (e.g., "draft-requests")
@@ -33,28 +51,42 @@ class PubSubClient:
         Returns:
             Message ID from Pub/Sub
         """
-        topic_path = self.publisher.topic_path(self.project_id, topic_id)
+        return self.publish_nowait(topic_id, message, attributes=attributes).result()
+
+    def publish_nowait(
+        self,
+        topic_id: str,
+        message: dict[str, Any],
+        *,
+        attributes: dict[str, str] | None = None,
+    ) -> Future:
+        """Queue a message for batched publishing without blocking.
+
+        Args:
+            topic_id: The topic ID (e.g., "draft-requests")
+            message: The message payload as a dictionary
+            attributes: Optional message attributes
+
+        Returns:
+            Future resolving to the Pub/Sub message ID
+        """
+        topic_path = self._topic_paths.get(topic_id)
+        if topic_path is None:
+            topic_path = self.publisher.topic_path(self.project_id, topic_id)
+            self._topic_paths[topic_id] = topic_path
 
         # Serialize message to JSON bytes
-        data = json.dumps(message).encode("utf-8")
+        data = orjson.dumps(message)
 
         # Publish with optional attributes
         future = self.publisher.publish(
             topic_path, data, **(attributes or {})
         )
-
-        message_id = future.result()
-
-        logger.info(
-            "Published message to Pub/Sub",
-            extra={
-                "topic_id": topic_id,
-                "message_id": message_id,
-                "attributes": attributes,
-            },
+        future.add_done_callback(
+            functools.partial(_log_publish_result, topic_id, attributes)
         )
 
-        return message_id
+        return future
 
     def publish_draft_request(
         self,
@@ -63,8 +95,8 @@ class PubSubClient:
         record_id: str,
         job_id: str,
         priority: str | None = None,
-    ) -> str:
-        """Publish a draft generation request.
+    ) -> Future:
+        """Publish a draft generation request without blocking.
 
         Args:
             source: Source system (e.g., "notion", "hubspot", "manual")
@@ -73,7 +105,7 @@ class PubSubClient:
             priority: Optional priority level
 
         Returns:
-            Message ID from Pub/Sub
+            Future resolving to the Pub/Sub message ID
         """
         message = {
             "job_id": job_id,
@@ -90,7 +122,7 @@ class PubSubClient:
         if priority:
             attributes["priority"] = priority
 
-        return self.publish("draft-requests", message, attributes=attributes)
+        return self.publish_nowait("draft-requests", message, attributes=attributes)
 
     def publish_draft_completed(
         self,
@@ -98,8 +130,8 @@ class PubSubClient:
         job_id: str,
         record_id: str,
         outputs: dict[str, Any],
-    ) -> str:
-        """Publish a draft completion notification.
+    ) -> Future:
+        """Publish a draft completion notification without blocking.
 
         Args:
             job_id: Job ID
@@ -107,7 +139,7 @@ class PubSubClient:
             outputs: Draft outputs (structure, wire, estimate, summary)
 
         Returns:
-            Message ID from Pub/Sub
+            Future resolving to the Pub/Sub message ID
         """
         message = {
             "job_id": job_id,
@@ -120,7 +152,30 @@ class PubSubClient:
             "event_type": "draft_completed",
         }
 
-        return self.publish("draft-completed", message, attributes=attributes)
+        return self.publish_nowait("draft-completed", message, attributes=attributes)
+
+
+def _log_publish_result(
+    topic_id: str, attributes: dict[str, str] | None, future: Future
+) -> None:
+    """Log the outcome of a batched publish once its future resolves."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(
+            "Failed to publish message to Pub/Sub",
+            exc_info=exc,
+            extra={"topic_id": topic_id, "attributes": attributes},
+        )
+        return
+
+    logger.info(
+        "Published message to Pub/Sub",
+        extra={
+            "topic_id": topic_id,
+            "message_id": future.result(),
+            "attributes": attributes,
+        },
+    )
 
 
-__all__ = ["PubSubClient"]
+__all__ = ["PubSubClient", "DEFAULT_BATCH_SETTINGS"]
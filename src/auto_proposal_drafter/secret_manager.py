@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+# Secrets rotate rarely; five minutes bounds how long a rotated value lingers.
+SECRET_TTL_SECONDS = 300.0
+_SECRET_CACHE_MAXSIZE = 128
+
+_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_lock = threading.Lock()
+_client: Any = None
+
+
+def _get_client() -> Any:
+    """Return the process-wide Secret Manager client, creating it on first use."""
+    global _client
+    if _client is None:
+        from google.cloud import secretmanager
+
+        with _lock:
+            if _client is None:
+                _client = secretmanager.SecretManagerServiceClient()
+    return _client
+
+
+def access_secret(project_id: str, secret_id: str) -> str:
+    """Fetch the latest version of a secret, cached for ``SECRET_TTL_SECONDS``.
+
+    Args:
+        project_id: GCP project ID
+        secret_id: Secret ID
+
+    Returns:
+        Secret value
+    """
+    key = (project_id, secret_id)
+    now = time.monotonic()
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+    # The network call happens outside the lock so one slow lookup does not
+    # block cache hits for other secrets.
+    name = f"projects/{project_id}/secrets/{secret_id}/versions/latest"
+    response = _get_client().access_secret_version(name=name)
+    value = response.payload.data.decode("UTF-8")
+
+    with _lock:
+        if len(_cache) >= _SECRET_CACHE_MAXSIZE and key not in _cache:
+            _cache.pop(min(_cache, key=lambda k: _cache[k][0]))
+        _cache[key] = (time.monotonic() + SECRET_TTL_SECONDS, value)
+    return value
+
+
+__all__ = ["access_secret", "SECRET_TTL_SECONDS"]
@@ -0,0 +1,59 @@
+import asyncio
+import importlib
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+for module in ("google.cloud.firestore", "google.cloud.pubsub_v1", "asana", "gspread", "notion_client"):
+    pytest.importorskip(module)
+
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setenv("ENVIRONMENT", "dev")
+    monkeypatch.delenv("PROJECT_ID", raising=False)
+    return importlib.import_module("services.api.main")
+
+
+def _generate_payload() -> dict:
+    opportunity = json.loads((ROOT / "data/opportunities/OPP-2025-001.json").read_text(encoding="utf-8"))
+    return {"record_id": opportunity["id"], "payload": opportunity}
+
+
+def _wait_for_job(client: TestClient, job_id: str) -> dict:
+    for _ in range(100):
+        job = client.get(f"/v1/jobs/{job_id}").json()
+        if job["status"] in ("COMPLETED", "FAILED"):
+            return job
+        time.sleep(0.05)
+    pytest.fail(f"job {job_id} did not finish")
+
+
+def test_generate_draft_completes_across_app_restarts(api):
+    # Each lifespan gets its own queue, so a second app start still drains jobs.
+    for _ in range(2):
+        with TestClient(api.app) as client:
+            response = client.post("/v1/drafts:generate", json=_generate_payload())
+            assert response.status_code == 200
+            assert response.json()["status"] == "QUEUED"
+
+            job = _wait_for_job(client, response.json()["job_id"])
+            assert job["status"] == "COMPLETED", job["errors"]
+            assert "提案サマリ" in job["outputs"]["summary"]
+
+
+def test_generate_draft_returns_503_when_queue_is_full(api):
+    with TestClient(api.app) as client:
+        full_queue = asyncio.Queue(maxsize=1)
+        full_queue.put_nowait(None)
+        client.app.state.draft_queue = full_queue
+
+        response = client.post("/v1/drafts:generate", json=_generate_payload())
+
+    assert response.status_code == 503
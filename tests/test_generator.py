@@ -1,6 +1,13 @@
+from datetime import date, timedelta
 from pathlib import Path
 
-from auto_proposal_drafter.generator import ProposalGenerator
+from auto_proposal_drafter.dictionaries import (
+    DEFAULT_COEFFICIENT_RULES,
+    GenerationContext,
+    evaluate_rules,
+    evaluate_rules_batch,
+)
+from auto_proposal_drafter.generator import BundleCache, ProposalGenerator
 from auto_proposal_drafter.models.opportunity import Opportunity
 
 
@@ -23,3 +30,51 @@ def test_generator_produces_expected_shapes():
     coeff_names = {coeff.name for coeff in bundle.estimate.coefficients}
     assert "短納期" in coeff_names
     assert "素材未提供（コピー）" in coeff_names
+
+
+def test_bundle_cache_keys_on_content_and_evicts_oldest():
+    opportunity = load_fixture("OPP-2025-001")
+    changed = opportunity.model_copy(update={"goal": "採用強化"})
+    today = date(2025, 10, 1)
+    bundle = ProposalGenerator().generate(opportunity)
+
+    cache = BundleCache(maxsize=1)
+    key = BundleCache.key_for(opportunity, today)
+    assert key == BundleCache.key_for(opportunity.model_copy(), today)
+    assert key != BundleCache.key_for(changed, today)
+    assert key != BundleCache.key_for(opportunity, today + timedelta(days=1))
+
+    cache.put(key, bundle)
+    assert cache.get(key) is bundle
+    cache.put(BundleCache.key_for(changed, today), bundle)
+    assert cache.get(key) is None
+
+
+def test_evaluate_rules_batch_matches_per_opportunity_rules():
+    opportunity = load_fixture("OPP-2025-001")
+    relaxed = opportunity.model_copy(update={"deadline": None, "notes": None})
+    context = GenerationContext(today=date(2025, 10, 1))
+
+    batch = evaluate_rules_batch([opportunity, relaxed], context, DEFAULT_COEFFICIENT_RULES)
+
+    assert batch == [
+        evaluate_rules(opportunity, context, DEFAULT_COEFFICIENT_RULES),
+        evaluate_rules(relaxed, context, DEFAULT_COEFFICIENT_RULES),
+    ]
+    assert "短納期" not in {coeff.name for coeff in batch[1]}
+
+    # Results never share coefficient instances between opportunities.
+    first, second = evaluate_rules_batch([opportunity, opportunity], context, DEFAULT_COEFFICIENT_RULES)
+    assert first == second
+    assert all(left is not right for left, right in zip(first, second))
+
+
+def test_generate_reuses_bundle_for_identical_opportunity():
+    opportunity = load_fixture("OPP-2025-001")
+    generator = ProposalGenerator()
+
+    bundle = generator.generate(opportunity)
+
+    assert generator.generate(opportunity.model_copy()) is bundle
+    assert generator.generate(opportunity.model_copy(update={"goal": "採用強化"})) is not bundle
+    assert ProposalGenerator(cache_size=0).generate(opportunity) is not bundle
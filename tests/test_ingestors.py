@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+
+from auto_proposal_drafter.ingestors import hubspot, notion
+from auto_proposal_drafter.ingestors.hubspot import HubSpotIngestor
+from auto_proposal_drafter.ingestors.notion import NotionIngestor
+
+
+class FakeDealSearchApi:
+    """Serves deals in ``limit``-sized pages, using the offset as the ``after`` cursor."""
+
+    def __init__(self, count: int) -> None:
+        self.deals = [
+            SimpleNamespace(id=str(index), properties={"dealname": f"Deal {index}"})
+            for index in range(count)
+        ]
+        self.requests: list[tuple[int, str | None]] = []
+
+    def do_search(self, *, public_object_search_request):
+        limit = public_object_search_request["limit"]
+        after = public_object_search_request.get("after")
+        self.requests.append((limit, after))
+        start = int(after or 0)
+        end = start + limit
+        paging = SimpleNamespace(next=SimpleNamespace(after=str(end))) if end < len(self.deals) else None
+        return SimpleNamespace(results=self.deals[start:end], paging=paging)
+
+
+class FakeDatabases:
+    """Serves Notion pages in ``page_size`` batches, using the offset as the cursor."""
+
+    def __init__(self, count: int, *, drop_cursor: bool = False) -> None:
+        self.pages = [{"id": f"page-{index}", "properties": {}} for index in range(count)]
+        self.drop_cursor = drop_cursor
+        self.requests: list[tuple[int, str | None]] = []
+
+    def query(self, **params):
+        page_size = params["page_size"]
+        cursor = params.get("start_cursor")
+        self.requests.append((page_size, cursor))
+        start = int(cursor or 0)
+        end = start + page_size
+        has_more = end < len(self.pages)
+        next_cursor = str(end) if has_more and not self.drop_cursor else None
+        return {"results": self.pages[start:end], "has_more": has_more, "next_cursor": next_cursor}
+
+
+def _hubspot_ingestor(search_api: FakeDealSearchApi) -> HubSpotIngestor:
+    # Skip __init__, which would import the HubSpot SDK.
+    ingestor = HubSpotIngestor.__new__(HubSpotIngestor)
+    ingestor.client = SimpleNamespace(crm=SimpleNamespace(deals=SimpleNamespace(search_api=search_api)))
+    return ingestor
+
+
+def _notion_ingestor(databases: FakeDatabases) -> NotionIngestor:
+    ingestor = NotionIngestor.__new__(NotionIngestor)
+    ingestor.database_id = "db"
+    ingestor.client = SimpleNamespace(databases=databases)
+    return ingestor
+
+
+def test_hubspot_pagination_stops_at_limit(monkeypatch):
+    monkeypatch.setattr(hubspot, "_PAGE_SIZE", 2)
+    search_api = FakeDealSearchApi(count=5)
+
+    opportunities = _hubspot_ingestor(search_api).list_opportunities(limit=3)
+
+    assert [opp.id for opp in opportunities] == ["0", "1", "2"]
+    assert search_api.requests == [(2, None), (1, "2")]
+
+
+def test_hubspot_pagination_stops_when_after_is_missing(monkeypatch):
+    monkeypatch.setattr(hubspot, "_PAGE_SIZE", 2)
+    search_api = FakeDealSearchApi(count=3)
+
+    opportunities = _hubspot_ingestor(search_api).list_opportunities(limit=100)
+
+    assert [opp.title for opp in opportunities] == ["Deal 0", "Deal 1", "Deal 2"]
+    assert search_api.requests == [(2, None), (2, "2")]
+
+
+def test_notion_pagination_stops_at_limit(monkeypatch):
+    monkeypatch.setattr(notion, "_PAGE_SIZE", 2)
+    databases = FakeDatabases(count=5)
+
+    opportunities = _notion_ingestor(databases).list_opportunities(limit=3)
+
+    assert [opp.id for opp in opportunities] == ["page-0", "page-1", "page-2"]
+    assert databases.requests == [(2, None), (1, "2")]
+
+
+@pytest.mark.parametrize(
+    ("drop_cursor", "expected_requests", "expected_ids"),
+    [
+        (False, [(2, None), (2, "2")], ["page-0", "page-1", "page-2"]),
+        # has_more without a next_cursor must end pagination, not loop.
+        (True, [(2, None)], ["page-0", "page-1"]),
+    ],
+)
+def test_notion_pagination_stops_without_next_cursor(
+    monkeypatch, drop_cursor, expected_requests, expected_ids
+):
+    monkeypatch.setattr(notion, "_PAGE_SIZE", 2)
+    databases = FakeDatabases(count=3, drop_cursor=drop_cursor)
+
+    opportunities = _notion_ingestor(databases).list_opportunities(limit=100)
+
+    assert [opp.id for opp in opportunities] == expected_ids
+    assert databases.requests == expected_requests
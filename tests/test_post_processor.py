@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+for module in ("asana", "gspread", "google.auth", "notion_client"):
+    pytest.importorskip(module)
+
+from auto_proposal_drafter.models.estimate import EstimateDraft, EstimateLineItem
+from auto_proposal_drafter.post_processor import PostProcessor
+
+
+def _post_processor(**clients) -> PostProcessor:
+    # Skip __init__, which would reach Secret Manager and Google auth.
+    post_processor = PostProcessor.__new__(PostProcessor)
+    for name, client in clients.items():
+        setattr(post_processor, name, client)
+    return post_processor
+
+
+def _estimate(**kwargs) -> EstimateDraft:
+    line_items = [
+        EstimateLineItem(item="設計", hours=10, rate=10000, role="PM"),
+        EstimateLineItem(item="実装", hours=20, rate=8000, role="FE"),
+    ]
+    return EstimateDraft(line_items=line_items, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("length", "segment_lengths"),
+    [(0, [0]), (2000, [2000]), (2001, [2000, 1])],
+)
+def test_update_notion_page_splits_summary_into_2000_char_segments(length, segment_lengths):
+    notion_client = MagicMock()
+    summary = "あ" * length
+
+    _post_processor(notion_client=notion_client)._update_notion_page(
+        page_id="page-1",
+        structure=MagicMock(),
+        estimate=_estimate(),
+        summary=summary,
+        proposed_at="2025-10-01T00:00:00+00:00",
+    )
+
+    heading, code = notion_client.blocks.children.append.call_args.kwargs["children"]
+    assert heading["type"] == "heading_2"
+    segments = [part["text"]["content"] for part in code["code"]["rich_text"]]
+    assert [len(segment) for segment in segments] == segment_lengths
+    assert "".join(segments) == summary
+
+
+@pytest.mark.parametrize(
+    ("coefficients", "expected_ranges"),
+    [
+        ([], ["A3:E4", "A8:B8"]),
+        (
+            [
+                {"name": "短納期", "multiplier": 1.2, "reason": "45日未満"},
+                {"name": "CMS", "multiplier": 1.1, "reason": None},
+            ],
+            ["A3:E4", "A7:C8", "A10:B10"],
+        ),
+    ],
+)
+def test_create_estimate_sheet_writes_all_ranges_in_one_batch(coefficients, expected_ranges):
+    sheets_client = MagicMock()
+    new_sheet = sheets_client.open_by_key.return_value.copy.return_value
+    estimate = _estimate(coefficients=coefficients)
+
+    url = _post_processor(sheets_client=sheets_client)._create_estimate_sheet(
+        template_id="template", job_id="job-1", estimate=estimate
+    )
+
+    assert url is new_sheet.url
+    (updates,), _ = new_sheet.sheet1.batch_update.call_args
+    assert [update["range"] for update in updates] == expected_ranges
+    assert updates[0]["values"][1] == ["実装", 1.0, 20.0, 8000.0, 160000.0]
+    total = 260000 * 1.2 * 1.1 if coefficients else 260000
+    assert updates[-1]["values"] == [["最終見積", f"¥{int(total):,}"]]